@@ -10,10 +10,26 @@ import pandas as pd
 import yaml
 import argparse
 from datetime import datetime
+from functools import lru_cache
 
 
-def load_account_config(account):
-    """Load account configuration to get R:R settings"""
+DEFAULT_CONFIG_FILE = "src/config.yaml"
+
+@lru_cache(maxsize=1)
+def _default_yaml_exists():
+    """Whether the default config exists; it does not change during a summary
+    run, so it is checked on first use and remembered"""
+    return os.path.exists(DEFAULT_CONFIG_FILE)
+
+
+def load_account_config(account, has_override=None):
+    """Load account configuration to get R:R settings
+
+    Args:
+        account: Account name (e.g., 'account1')
+        has_override: Whether {account}/config.yaml exists. Pass the result of a
+                      prior scan to skip the per-account stat; None checks the disk.
+    """
     # Default config
     default_config = {
         'stoploss': {'spread_buffer_pips': 3},
@@ -25,15 +41,16 @@ def load_account_config(account):
     }
 
     # Load default YAML config
-    default_config_file = "src/config.yaml"
-    if os.path.exists(default_config_file):
-        with open(default_config_file, 'r') as f:
+    if _default_yaml_exists():
+        with open(DEFAULT_CONFIG_FILE, 'r') as f:
             loaded_default = yaml.safe_load(f) or {}
             deep_merge(default_config, loaded_default)
 
     # Load account-specific overrides
     account_config_file = f"{account}/config.yaml"
-    if os.path.exists(account_config_file):
+    if has_override is None:
+        has_override = os.path.exists(account_config_file)
+    if has_override:
         with open(account_config_file, 'r') as f:
             account_config = yaml.safe_load(f) or {}
         deep_merge(default_config, account_config)
@@ -94,85 +111,127 @@ def format_rr(value):
     return f"{value:.1f}:1"
 
 
-def generate_summary_report(accounts, csv_files, instrument, timeframe, start_date, end_date, initial_balance=10000, market_override=None):
-    """Generate summary report from multiple backtest results"""
+def collect_summary_results(accounts, csv_files, initial_balance=10000):
+    """Load each account's config and analyze its backtest CSV"""
     results = []
 
+    # Check each distinct account for an override config once, even when it
+    # appears several times in the run
+    existing_cfgs = {a for a in set(accounts) if os.path.exists(f"{a}/config.yaml")}
+
     for account, csv_file in zip(accounts, csv_files):
-        config = load_account_config(account)
+        config = load_account_config(account, has_override=account in existing_cfgs)
         analysis = analyze_backtest_csv(csv_file)
 
         # Extract account number for display
         account_num = account.replace('account', '')
 
+        # Formatted R:R settings, shared by the CSV report and console table
+        rr = (
+            format_rr(config['risk_reward']['bear_market']['short_rr']),
+            format_rr(config['risk_reward']['bear_market']['long_rr']),
+            format_rr(config['risk_reward']['bull_market']['short_rr']),
+            format_rr(config['risk_reward']['bull_market']['long_rr']),
+            f"{config['stoploss']['spread_buffer_pips']} pips",
+        )
+
         results.append({
             'account': account,
             'account_num': account_num,
             'config': config,
+            'rr': rr,
             'analysis': analysis,
             'final_balance': initial_balance + analysis['total_pl']
         })
 
-    # Generate report content
-    report_lines = []
-    report_lines.append("Backtest Summary Report")
-    report_lines.append(f"Period: {start_date} - {end_date} ({instrument.replace('_', '/')} {timeframe})")
+    return results
+
+
+def write_summary_report(results, instrument, timeframe, start_date, end_date, market_override=None, out=None):
+    """Format collected results as the summary report
+
+    When ``out`` (a writable text file object) is given, report lines are
+    streamed straight to it and ``None`` is returned in place of the content.
+    """
+    # Generate report content, streamed to `out` or collected for joining
+    if out is None:
+        report_lines = []
+        emit = report_lines.append
+    else:
+        started = False
+
+        def emit(line):
+            nonlocal started
+            if started:
+                out.write("\n")
+            out.write(line)
+            started = True
+
+    emit("Backtest Summary Report")
+    emit(f"Period: {start_date} - {end_date} ({instrument.replace('_', '/')} {timeframe})")
     if market_override:
-        report_lines.append(f"Market Override: {market_override.upper()} (3H calculation disabled)")
-    report_lines.append("")
+        emit(f"Market Override: {market_override.upper()} (3H calculation disabled)")
+    emit("")
 
     # Key Settings Info (at top of report)
-    report_lines.append("Key Settings")
+    emit("Key Settings")
     for r in results:
         cfg = r['config']
         disable_opposite = cfg.get('position_sizing', {}).get('disable_opposite_trade', False)
         disable_str = "YES" if disable_opposite else "NO"
-        report_lines.append(f"Account {r['account_num']}: disable_opposite_trade={disable_str}")
-    report_lines.append("")
+        emit(f"Account {r['account_num']}: disable_opposite_trade={disable_str}")
+    emit("")
 
     # Configuration Settings Table
-    report_lines.append("Configuration Settings (R:R Ratios)")
-    report_lines.append("Account,Bear Short,Bear Long,Bull Short,Bull Long,Buffer")
+    emit("Configuration Settings (R:R Ratios)")
+    emit("Account,Bear Short,Bear Long,Bull Short,Bull Long,Buffer")
     for r in results:
-        cfg = r['config']
-        bear_short = format_rr(cfg['risk_reward']['bear_market']['short_rr'])
-        bear_long = format_rr(cfg['risk_reward']['bear_market']['long_rr'])
-        bull_short = format_rr(cfg['risk_reward']['bull_market']['short_rr'])
-        bull_long = format_rr(cfg['risk_reward']['bull_market']['long_rr'])
-        buffer = f"{cfg['stoploss']['spread_buffer_pips']} pips"
-        report_lines.append(f"{r['account_num']},{bear_short},{bear_long},{bull_short},{bull_long},{buffer}")
+        bear_short, bear_long, bull_short, bull_long, buffer = r['rr']
+        emit(f"{r['account_num']},{bear_short},{bear_long},{bull_short},{bull_long},{buffer}")
 
-    report_lines.append("")
+    emit("")
 
     # Results Table
-    report_lines.append("Results")
-    report_lines.append("Account,Trades,TP Hits,Win Rate,Total P/L,Final Balance")
+    emit("Results")
+    emit("Account,Trades,TP Hits,Win Rate,Total P/L,Final Balance")
     for r in results:
         a = r['analysis']
         pl_str = f"+${a['total_pl']:.0f}" if a['total_pl'] >= 0 else f"-${abs(a['total_pl']):.0f}"
-        report_lines.append(f"{r['account_num']},{a['total_trades']},{a['tp_hits']},{a['win_rate']:.1f}%,{pl_str},${r['final_balance']:.0f}")
+        emit(f"{r['account_num']},{a['total_trades']},{a['tp_hits']},{a['win_rate']:.1f}%,{pl_str},${r['final_balance']:.0f}")
 
-    report_lines.append("")
+    emit("")
 
     # Trade Breakdown by Direction
-    report_lines.append("Trade Breakdown by Direction")
-    report_lines.append("Account,BUY Trades,BUY Win %,SELL Trades,SELL Win %")
+    emit("Trade Breakdown by Direction")
+    emit("Account,BUY Trades,BUY Win %,SELL Trades,SELL Win %")
     for r in results:
         a = r['analysis']
-        report_lines.append(f"{r['account_num']},{a['buy_count']},{a['buy_win_rate']:.1f}%,{a['sell_count']},{a['sell_win_rate']:.1f}%")
+        emit(f"{r['account_num']},{a['buy_count']},{a['buy_win_rate']:.1f}%,{a['sell_count']},{a['sell_win_rate']:.1f}%")
+
+    if out is None:
+        return "\n".join(report_lines)
+    return None
 
-    return "\n".join(report_lines), results
+
+def generate_summary_report(accounts, csv_files, instrument, timeframe, start_date, end_date, initial_balance=10000, market_override=None, out=None):
+    """Generate summary report from multiple backtest results
+
+    When ``out`` (a writable text file object) is given, report lines are
+    streamed straight to it and ``None`` is returned in place of the content.
+    """
+    results = collect_summary_results(accounts, csv_files, initial_balance)
+    content = write_summary_report(results, instrument, timeframe, start_date, end_date, market_override, out=out)
+    return content, results
 
 
 def generate_summary_csv(accounts, csv_files, output_path, instrument, timeframe, start_date, end_date, initial_balance=10000, market_override=None):
     """Generate summary CSV from multiple backtest results"""
-    report_content, results = generate_summary_report(
-        accounts, csv_files, instrument, timeframe, start_date, end_date, initial_balance, market_override
-    )
+    # Read every input first so a bad CSV can't truncate an existing summary
+    results = collect_summary_results(accounts, csv_files, initial_balance)
 
-    # Write to CSV file
-    with open(output_path, 'w') as f:
-        f.write(report_content)
+    # Then stream only the formatting into the CSV file
+    with open(output_path, 'w', buffering=64 * 1024) as f:
+        write_summary_report(results, instrument, timeframe, start_date, end_date, market_override, out=f)
 
     return output_path, results
 
@@ -204,12 +263,7 @@ def print_summary_table(results, instrument, timeframe, start_date, end_date, in
     print("-" * 80)
 
     for r in results:
-        cfg = r['config']
-        bear_short = format_rr(cfg['risk_reward']['bear_market']['short_rr'])
-        bear_long = format_rr(cfg['risk_reward']['bear_market']['long_rr'])
-        bull_short = format_rr(cfg['risk_reward']['bull_market']['short_rr'])
-        bull_long = format_rr(cfg['risk_reward']['bull_market']['long_rr'])
-        buffer = f"{cfg['stoploss']['spread_buffer_pips']} pips"
+        bear_short, bear_long, bull_short, bull_long, buffer = r['rr']
         print(f"{r['account_num']:^10} {bear_short:^12} {bear_long:^12} {bull_short:^12} {bull_long:^12} {buffer:^10}")
 
     # Results Table
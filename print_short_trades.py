@@ -3,317 +3,394 @@
 Print all ALLOWED SHORT trades from Jan 4-9 analysis
 """
 
-def print_all_short_trades():
-    """Print detailed information for all 14 allowed SHORT trades"""
-    
-    print("🎯 ALL ALLOWED SHORT TRADES (Jan 4-9, 2026)")
-    print("=" * 80)
-    print("Market Trend: BEAR (throughout entire period)")
-    print("Trading Strategy: Only SHORT trades allowed (LONG trades filtered)")
-    print("Take Profit Strategy: 1:1 risk/reward ratio")
-    print("=" * 80)
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+
+Trade = namedtuple('Trade', [
+    'id',
+    'time',
+    'entry_price',
+    'supertrend',
+    'stop_loss',
+    'take_profit',
+    'next_signal_time',
+    'highest_price',
+    'highest_time',
+    'lowest_price',
+    'lowest_time',
+    'unrealized_pl_high',
+    'unrealized_pl_low',
+    'max_rr_ratio',
+    # Derived fields, filled in by _annotate() at import time
+    'risk_per_1000',
+    'analysis',
+    'recommendation'
+], defaults=(None, None, None))
+
+
+def _rr_label(max_rr_ratio):
+    """Analysis label for a trade's max risk:reward ratio"""
+    if max_rr_ratio >= 2.0:
+        return "🌟 EXCELLENT - High profit potential"
+    elif max_rr_ratio >= 1.5:
+        return "✅ GOOD - Solid profit opportunity"
+    elif max_rr_ratio >= 1.0:
+        return "🆗 FAIR - Moderate profit potential"
+    else:
+        return "⚠️  LIMITED - Low profit potential"
+
+
+def _pl_rec(unrealized_pl_low):
+    """Take-profit recommendation from the best unrealized P&L"""
+    if unrealized_pl_low >= 2.0:
+        return "Consider 2:1 or 3:1 take profit ratio"
+    elif unrealized_pl_low >= 1.0:
+        return "1:1 ratio is optimal"
+    else:
+        return "Very tight stop needed"
+
+
+def _annotate(trade, risk_per_1000):
+    """Attach the derived risk/analysis/recommendation fields to a trade"""
+    return trade._replace(
+        risk_per_1000=risk_per_1000,
+        analysis=_rr_label(trade.max_rr_ratio),
+        recommendation=_pl_rec(trade.unrealized_pl_low)
+    )
+
+
+# Static trade dataset, built once at import time
+_RAW_SHORT_TRADES = (
+    Trade(
+        id=1,
+        time='2026-01-04 22:55:00',
+        entry_price=1.17116,
+        supertrend=1.17248,
+        stop_loss=1.17258,
+        take_profit=1.16974,
+        next_signal_time='2026-01-05 05:40:00',
+        highest_price=1.17130,
+        highest_time='2026-01-04 23:05:00',
+        lowest_price=1.16722,
+        lowest_time='2026-01-05 03:30:00',
+        unrealized_pl_high=-0.14,
+        unrealized_pl_low=3.94,
+        max_rr_ratio=2.78
+    ),
+    Trade(
+        id=2,
+        time='2026-01-05 09:40:00',
+        entry_price=1.16757,
+        supertrend=1.16950,
+        stop_loss=1.16960,
+        take_profit=1.16554,
+        next_signal_time='2026-01-05 15:00:00',
+        highest_price=1.16953,
+        highest_time='2026-01-05 15:00:00',
+        lowest_price=1.16592,
+        lowest_time='2026-01-05 13:35:00',
+        unrealized_pl_high=-1.96,
+        unrealized_pl_low=1.65,
+        max_rr_ratio=0.81
+    ),
+    Trade(
+        id=3,
+        time='2026-01-05 21:40:00',
+        entry_price=1.17206,
+        supertrend=1.17297,
+        stop_loss=1.17307,
+        take_profit=1.17105,
+        next_signal_time='2026-01-06 01:40:00',
+        highest_price=1.17232,
+        highest_time='2026-01-05 22:20:00',
+        lowest_price=1.17106,
+        lowest_time='2026-01-06 00:40:00',
+        unrealized_pl_high=-0.26,
+        unrealized_pl_low=1.00,
+        max_rr_ratio=0.99
+    ),
+    Trade(
+        id=4,
+        time='2026-01-06 05:50:00',
+        entry_price=1.17300,
+        supertrend=1.17377,
+        stop_loss=1.17387,
+        take_profit=1.17213,
+        next_signal_time='2026-01-06 07:00:00',
+        highest_price=1.17406,
+        highest_time='2026-01-06 07:00:00',
+        lowest_price=1.17273,
+        lowest_time='2026-01-06 05:55:00',
+        unrealized_pl_high=-1.06,
+        unrealized_pl_low=0.27,
+        max_rr_ratio=0.31
+    ),
+    Trade(
+        id=5,
+        time='2026-01-06 07:55:00',
+        entry_price=1.17291,
+        supertrend=1.17441,
+        stop_loss=1.17451,
+        take_profit=1.17131,
+        next_signal_time='2026-01-06 14:00:00',
+        highest_price=1.17390,
+        highest_time='2026-01-06 08:15:00',
+        lowest_price=1.16972,
+        lowest_time='2026-01-06 12:55:00',
+        unrealized_pl_high=-0.99,
+        unrealized_pl_low=3.19,
+        max_rr_ratio=2.00
+    ),
+    Trade(
+        id=6,
+        time='2026-01-06 15:10:00',
+        entry_price=1.16958,
+        supertrend=1.17218,
+        stop_loss=1.17228,
+        take_profit=1.16688,
+        next_signal_time='2026-01-06 18:00:00',
+        highest_price=1.17022,
+        highest_time='2026-01-06 18:00:00',
+        lowest_price=1.16840,
+        lowest_time='2026-01-06 15:40:00',
+        unrealized_pl_high=-0.64,
+        unrealized_pl_low=1.18,
+        max_rr_ratio=0.44
+    ),
+    Trade(
+        id=7,
+        time='2026-01-06 18:50:00',
+        entry_price=1.16874,
+        supertrend=1.17036,
+        stop_loss=1.17046,
+        take_profit=1.16702,
+        next_signal_time='2026-01-07 00:30:00',
+        highest_price=1.16932,
+        highest_time='2026-01-06 20:40:00',
+        lowest_price=1.16840,
+        lowest_time='2026-01-06 19:35:00',
+        unrealized_pl_high=-0.58,
+        unrealized_pl_low=0.34,
+        max_rr_ratio=0.20
+    ),
+    Trade(
+        id=8,
+        time='2026-01-07 04:50:00',
+        entry_price=1.16934,
+        supertrend=1.17035,
+        stop_loss=1.17045,
+        take_profit=1.16823,
+        next_signal_time='2026-01-07 06:50:00',
+        highest_price=1.16998,
+        highest_time='2026-01-07 06:50:00',
+        lowest_price=1.16909,
+        lowest_time='2026-01-07 05:00:00',
+        unrealized_pl_high=-0.64,
+        unrealized_pl_low=0.25,
+        max_rr_ratio=0.23
+    ),
+    Trade(
+        id=9,
+        time='2026-01-07 07:30:00',
+        entry_price=1.16864,
+        supertrend=1.17022,
+        stop_loss=1.17032,
+        take_profit=1.16696,
+        next_signal_time='2026-01-07 11:15:00',
+        highest_price=1.16938,
+        highest_time='2026-01-07 10:35:00',
+        lowest_price=1.16729,
+        lowest_time='2026-01-07 08:25:00',
+        unrealized_pl_high=-0.74,
+        unrealized_pl_low=1.35,
+        max_rr_ratio=0.80
+    ),
+    Trade(
+        id=10,
+        time='2026-01-07 18:55:00',
+        entry_price=1.16830,
+        supertrend=1.16949,
+        stop_loss=1.16959,
+        take_profit=1.16701,
+        next_signal_time='2026-01-08 02:40:00',
+        highest_price=1.16854,
+        highest_time='2026-01-07 19:05:00',
+        lowest_price=1.16728,
+        lowest_time='2026-01-08 01:35:00',
+        unrealized_pl_high=-0.24,
+        unrealized_pl_low=1.02,
+        max_rr_ratio=0.79
+    ),
+    Trade(
+        id=11,
+        time='2026-01-08 08:15:00',
+        entry_price=1.16739,
+        supertrend=1.16839,
+        stop_loss=1.16849,
+        take_profit=1.16629,
+        next_signal_time='2026-01-08 20:25:00',
+        highest_price=1.16820,
+        highest_time='2026-01-08 10:10:00',
+        lowest_price=1.16426,
+        lowest_time='2026-01-08 19:00:00',
+        unrealized_pl_high=-0.81,
+        unrealized_pl_low=3.13,
+        max_rr_ratio=2.85
+    ),
+    Trade(
+        id=12,
+        time='2026-01-09 00:10:00',
+        entry_price=1.16550,
+        supertrend=1.16609,
+        stop_loss=1.16619,
+        take_profit=1.16481,
+        next_signal_time='2026-01-09 03:05:00',
+        highest_price=1.16576,
+        highest_time='2026-01-09 00:20:00',
+        lowest_price=1.16460,
+        lowest_time='2026-01-09 02:10:00',
+        unrealized_pl_high=-0.26,
+        unrealized_pl_low=0.90,
+        max_rr_ratio=1.31
+    ),
+    Trade(
+        id=13,
+        time='2026-01-09 05:35:00',
+        entry_price=1.16508,
+        supertrend=1.16578,
+        stop_loss=1.16588,
+        take_profit=1.16428,
+        next_signal_time='2026-01-09 13:30:00',
+        highest_price=1.16559,
+        highest_time='2026-01-09 13:30:00',
+        lowest_price=1.16256,
+        lowest_time='2026-01-09 13:30:00',
+        unrealized_pl_high=-0.51,
+        unrealized_pl_low=2.52,
+        max_rr_ratio=3.15
+    ),
+    Trade(
+        id=14,
+        time='2026-01-09 14:25:00',
+        entry_price=1.16382,
+        supertrend=1.16656,
+        stop_loss=1.16666,
+        take_profit=1.16098,
+        next_signal_time='2026-01-09 16:00:00',
+        highest_price=1.16445,
+        highest_time='2026-01-09 14:35:00',
+        lowest_price=1.16182,
+        lowest_time='2026-01-09 15:20:00',
+        unrealized_pl_high=-0.63,
+        unrealized_pl_low=2.00,
+        max_rr_ratio=0.70
+    )
+)
+
+# Numeric columns (SoA) for vectorized math; float64 keeps the printed
+# 5-decimal prices and 2-decimal risks identical to the source values
+ENTRY = np.array([t.entry_price for t in _RAW_SHORT_TRADES], dtype=np.float64)
+STOP = np.array([t.stop_loss for t in _RAW_SHORT_TRADES], dtype=np.float64)
+TP = np.array([t.take_profit for t in _RAW_SHORT_TRADES], dtype=np.float64)
+RR = np.array([t.max_rr_ratio for t in _RAW_SHORT_TRADES], dtype=np.float64)
+PLL = np.array([t.unrealized_pl_low for t in _RAW_SHORT_TRADES], dtype=np.float64)
+PLH = np.array([t.unrealized_pl_high for t in _RAW_SHORT_TRADES], dtype=np.float64)
+
+RISK_PER_1000 = (STOP - ENTRY) * 1000
+
+# Per-trade records (with string fields) for the detailed report
+SHORT_TRADES = tuple(
+    _annotate(t, risk) for t, risk in zip(_RAW_SHORT_TRADES, RISK_PER_1000.tolist())
+)
+
+
+def build_short_trades_report():
+    """Build the detailed report for all 14 allowed SHORT trades from SHORT_TRADES"""
     
-    short_trades = [
-        {
-            'id': 1,
-            'time': '2026-01-04 22:55:00',
-            'entry_price': 1.17116,
-            'supertrend': 1.17248,
-            'stop_loss': 1.17258,
-            'take_profit': 1.16974,
-            'next_signal_time': '2026-01-05 05:40:00',
-            'highest_price': 1.17130,
-            'highest_time': '2026-01-04 23:05:00',
-            'lowest_price': 1.16722,
-            'lowest_time': '2026-01-05 03:30:00',
-            'unrealized_pl_high': -0.14,
-            'unrealized_pl_low': 3.94,
-            'max_rr_ratio': 2.78
-        },
-        {
-            'id': 2,
-            'time': '2026-01-05 09:40:00',
-            'entry_price': 1.16757,
-            'supertrend': 1.16950,
-            'stop_loss': 1.16960,
-            'take_profit': 1.16554,
-            'next_signal_time': '2026-01-05 15:00:00',
-            'highest_price': 1.16953,
-            'highest_time': '2026-01-05 15:00:00',
-            'lowest_price': 1.16592,
-            'lowest_time': '2026-01-05 13:35:00',
-            'unrealized_pl_high': -1.96,
-            'unrealized_pl_low': 1.65,
-            'max_rr_ratio': 0.81
-        },
-        {
-            'id': 3,
-            'time': '2026-01-05 21:40:00',
-            'entry_price': 1.17206,
-            'supertrend': 1.17297,
-            'stop_loss': 1.17307,
-            'take_profit': 1.17105,
-            'next_signal_time': '2026-01-06 01:40:00',
-            'highest_price': 1.17232,
-            'highest_time': '2026-01-05 22:20:00',
-            'lowest_price': 1.17106,
-            'lowest_time': '2026-01-06 00:40:00',
-            'unrealized_pl_high': -0.26,
-            'unrealized_pl_low': 1.00,
-            'max_rr_ratio': 0.99
-        },
-        {
-            'id': 4,
-            'time': '2026-01-06 05:50:00',
-            'entry_price': 1.17300,
-            'supertrend': 1.17377,
-            'stop_loss': 1.17387,
-            'take_profit': 1.17213,
-            'next_signal_time': '2026-01-06 07:00:00',
-            'highest_price': 1.17406,
-            'highest_time': '2026-01-06 07:00:00',
-            'lowest_price': 1.17273,
-            'lowest_time': '2026-01-06 05:55:00',
-            'unrealized_pl_high': -1.06,
-            'unrealized_pl_low': 0.27,
-            'max_rr_ratio': 0.31
-        },
-        {
-            'id': 5,
-            'time': '2026-01-06 07:55:00',
-            'entry_price': 1.17291,
-            'supertrend': 1.17441,
-            'stop_loss': 1.17451,
-            'take_profit': 1.17131,
-            'next_signal_time': '2026-01-06 14:00:00',
-            'highest_price': 1.17390,
-            'highest_time': '2026-01-06 08:15:00',
-            'lowest_price': 1.16972,
-            'lowest_time': '2026-01-06 12:55:00',
-            'unrealized_pl_high': -0.99,
-            'unrealized_pl_low': 3.19,
-            'max_rr_ratio': 2.00
-        },
-        {
-            'id': 6,
-            'time': '2026-01-06 15:10:00',
-            'entry_price': 1.16958,
-            'supertrend': 1.17218,
-            'stop_loss': 1.17228,
-            'take_profit': 1.16688,
-            'next_signal_time': '2026-01-06 18:00:00',
-            'highest_price': 1.17022,
-            'highest_time': '2026-01-06 18:00:00',
-            'lowest_price': 1.16840,
-            'lowest_time': '2026-01-06 15:40:00',
-            'unrealized_pl_high': -0.64,
-            'unrealized_pl_low': 1.18,
-            'max_rr_ratio': 0.44
-        },
-        {
-            'id': 7,
-            'time': '2026-01-06 18:50:00',
-            'entry_price': 1.16874,
-            'supertrend': 1.17036,
-            'stop_loss': 1.17046,
-            'take_profit': 1.16702,
-            'next_signal_time': '2026-01-07 00:30:00',
-            'highest_price': 1.16932,
-            'highest_time': '2026-01-06 20:40:00',
-            'lowest_price': 1.16840,
-            'lowest_time': '2026-01-06 19:35:00',
-            'unrealized_pl_high': -0.58,
-            'unrealized_pl_low': 0.34,
-            'max_rr_ratio': 0.20
-        },
-        {
-            'id': 8,
-            'time': '2026-01-07 04:50:00',
-            'entry_price': 1.16934,
-            'supertrend': 1.17035,
-            'stop_loss': 1.17045,
-            'take_profit': 1.16823,
-            'next_signal_time': '2026-01-07 06:50:00',
-            'highest_price': 1.16998,
-            'highest_time': '2026-01-07 06:50:00',
-            'lowest_price': 1.16909,
-            'lowest_time': '2026-01-07 05:00:00',
-            'unrealized_pl_high': -0.64,
-            'unrealized_pl_low': 0.25,
-            'max_rr_ratio': 0.23
-        },
-        {
-            'id': 9,
-            'time': '2026-01-07 07:30:00',
-            'entry_price': 1.16864,
-            'supertrend': 1.17022,
-            'stop_loss': 1.17032,
-            'take_profit': 1.16696,
-            'next_signal_time': '2026-01-07 11:15:00',
-            'highest_price': 1.16938,
-            'highest_time': '2026-01-07 10:35:00',
-            'lowest_price': 1.16729,
-            'lowest_time': '2026-01-07 08:25:00',
-            'unrealized_pl_high': -0.74,
-            'unrealized_pl_low': 1.35,
-            'max_rr_ratio': 0.80
-        },
-        {
-            'id': 10,
-            'time': '2026-01-07 18:55:00',
-            'entry_price': 1.16830,
-            'supertrend': 1.16949,
-            'stop_loss': 1.16959,
-            'take_profit': 1.16701,
-            'next_signal_time': '2026-01-08 02:40:00',
-            'highest_price': 1.16854,
-            'highest_time': '2026-01-07 19:05:00',
-            'lowest_price': 1.16728,
-            'lowest_time': '2026-01-08 01:35:00',
-            'unrealized_pl_high': -0.24,
-            'unrealized_pl_low': 1.02,
-            'max_rr_ratio': 0.79
-        },
-        {
-            'id': 11,
-            'time': '2026-01-08 08:15:00',
-            'entry_price': 1.16739,
-            'supertrend': 1.16839,
-            'stop_loss': 1.16849,
-            'take_profit': 1.16629,
-            'next_signal_time': '2026-01-08 20:25:00',
-            'highest_price': 1.16820,
-            'highest_time': '2026-01-08 10:10:00',
-            'lowest_price': 1.16426,
-            'lowest_time': '2026-01-08 19:00:00',
-            'unrealized_pl_high': -0.81,
-            'unrealized_pl_low': 3.13,
-            'max_rr_ratio': 2.85
-        },
-        {
-            'id': 12,
-            'time': '2026-01-09 00:10:00',
-            'entry_price': 1.16550,
-            'supertrend': 1.16609,
-            'stop_loss': 1.16619,
-            'take_profit': 1.16481,
-            'next_signal_time': '2026-01-09 03:05:00',
-            'highest_price': 1.16576,
-            'highest_time': '2026-01-09 00:20:00',
-            'lowest_price': 1.16460,
-            'lowest_time': '2026-01-09 02:10:00',
-            'unrealized_pl_high': -0.26,
-            'unrealized_pl_low': 0.90,
-            'max_rr_ratio': 1.31
-        },
-        {
-            'id': 13,
-            'time': '2026-01-09 05:35:00',
-            'entry_price': 1.16508,
-            'supertrend': 1.16578,
-            'stop_loss': 1.16588,
-            'take_profit': 1.16428,
-            'next_signal_time': '2026-01-09 13:30:00',
-            'highest_price': 1.16559,
-            'highest_time': '2026-01-09 13:30:00',
-            'lowest_price': 1.16256,
-            'lowest_time': '2026-01-09 13:30:00',
-            'unrealized_pl_high': -0.51,
-            'unrealized_pl_low': 2.52,
-            'max_rr_ratio': 3.15
-        },
-        {
-            'id': 14,
-            'time': '2026-01-09 14:25:00',
-            'entry_price': 1.16382,
-            'supertrend': 1.16656,
-            'stop_loss': 1.16666,
-            'take_profit': 1.16098,
-            'next_signal_time': '2026-01-09 16:00:00',
-            'highest_price': 1.16445,
-            'highest_time': '2026-01-09 14:35:00',
-            'lowest_price': 1.16182,
-            'lowest_time': '2026-01-09 15:20:00',
-            'unrealized_pl_high': -0.63,
-            'unrealized_pl_low': 2.00,
-            'max_rr_ratio': 0.70
-        }
-    ]
+    out = []
+    out.append("🎯 ALL ALLOWED SHORT TRADES (Jan 4-9, 2026)")
+    out.append("=" * 80)
+    out.append("Market Trend: BEAR (throughout entire period)")
+    out.append("Trading Strategy: Only SHORT trades allowed (LONG trades filtered)")
+    out.append("Take Profit Strategy: 1:1 risk/reward ratio")
+    out.append("=" * 80)
     
-    for trade in short_trades:
-        print(f"\n[{trade['id']:2d}] SHORT TRADE - {trade['time']}")
-        print(f"     📍 Entry Price:     {trade['entry_price']:.5f}")
-        print(f"     🔴 Stop Loss:       {trade['stop_loss']:.5f}  (Risk: {(trade['stop_loss'] - trade['entry_price']) * 1000:.2f} per 1000 units)")
-        print(f"     🎯 Take Profit:     {trade['take_profit']:.5f}  (1:1 Ratio)")
-        print(f"     📈 SuperTrend:      {trade['supertrend']:.5f}")
-        print(f"     ⏰ Signal Duration: {trade['time']} to {trade['next_signal_time']}")
+    for trade in SHORT_TRADES:
+        out.append(f"\n[{trade.id:2d}] SHORT TRADE - {trade.time}")
+        out.append(f"     📍 Entry Price:     {trade.entry_price:.5f}")
+        out.append(f"     🔴 Stop Loss:       {trade.stop_loss:.5f}  (Risk: {trade.risk_per_1000:.2f} per 1000 units)")
+        out.append(f"     🎯 Take Profit:     {trade.take_profit:.5f}  (1:1 Ratio)")
+        out.append(f"     📈 SuperTrend:      {trade.supertrend:.5f}")
+        out.append(f"     ⏰ Signal Duration: {trade.time} to {trade.next_signal_time}")
         
-        print(f"     📊 PRICE EXTREMES:")
-        print(f"        🔺 HIGHEST: {trade['highest_price']:.5f} at {trade['highest_time']}")
-        print(f"        🔻 LOWEST:  {trade['lowest_price']:.5f} at {trade['lowest_time']}")
+        out.append(f"     📊 PRICE EXTREMES:")
+        out.append(f"        🔺 HIGHEST: {trade.highest_price:.5f} at {trade.highest_time}")
+        out.append(f"        🔻 LOWEST:  {trade.lowest_price:.5f} at {trade.lowest_time}")
         
-        print(f"     💰 UNREALIZED P&L (per 1000 units):")
-        print(f"        At HIGH point: ${trade['unrealized_pl_high']:+.2f}")
-        print(f"        At LOW point:  ${trade['unrealized_pl_low']:+.2f}")
+        out.append(f"     💰 UNREALIZED P&L (per 1000 units):")
+        out.append(f"        At HIGH point: ${trade.unrealized_pl_high:+.2f}")
+        out.append(f"        At LOW point:  ${trade.unrealized_pl_low:+.2f}")
         
-        print(f"     🎯 MAX RISK:REWARD: {trade['max_rr_ratio']:.2f}:1")
+        out.append(f"     🎯 MAX RISK:REWARD: {trade.max_rr_ratio:.2f}:1")
         
-        # Analysis
-        if trade['max_rr_ratio'] >= 2.0:
-            analysis = "🌟 EXCELLENT - High profit potential"
-        elif trade['max_rr_ratio'] >= 1.5:
-            analysis = "✅ GOOD - Solid profit opportunity"
-        elif trade['max_rr_ratio'] >= 1.0:
-            analysis = "🆗 FAIR - Moderate profit potential"
-        else:
-            analysis = "⚠️  LIMITED - Low profit potential"
+        out.append(f"     📝 Analysis: {trade.analysis}")
+        out.append(f"     💡 Recommendation: {trade.recommendation}")
         
-        print(f"     📝 Analysis: {analysis}")
-        
-        if trade['unrealized_pl_low'] >= 2.0:
-            print(f"     💡 Recommendation: Consider 2:1 or 3:1 take profit ratio")
-        elif trade['unrealized_pl_low'] >= 1.0:
-            print(f"     💡 Recommendation: 1:1 ratio is optimal")
-        else:
-            print(f"     💡 Recommendation: Very tight stop needed")
-        
-        print(f"     {'-' * 60}")
+        out.append(f"     {'-' * 60}")
     
     # Summary statistics
-    print(f"\n{'=' * 80}")
-    print(f"📊 SUMMARY STATISTICS")
-    print(f"{'=' * 80}")
+    out.append(f"\n{'=' * 80}")
+    out.append(f"📊 SUMMARY STATISTICS")
+    out.append(f"{'=' * 80}")
     
-    total_trades = len(short_trades)
-    profitable_at_low = sum(1 for trade in short_trades if trade['unrealized_pl_low'] > 0)
-    avg_max_rr = sum(trade['max_rr_ratio'] for trade in short_trades) / total_trades
-    best_rr = max(trade['max_rr_ratio'] for trade in short_trades)
-    worst_rr = min(trade['max_rr_ratio'] for trade in short_trades)
+    total_trades = len(SHORT_TRADES)
+    profitable_at_low = int((PLL > 0).sum())
+    avg_max_rr = RR.mean()
+    best_idx = int(RR.argmax())
+    worst_idx = int(RR.argmin())
+    best_rr = RR[best_idx]
+    worst_rr = RR[worst_idx]
     
-    high_rr_trades = sum(1 for trade in short_trades if trade['max_rr_ratio'] >= 2.0)
-    excellent_trades = [trade for trade in short_trades if trade['max_rr_ratio'] >= 2.0]
+    high_rr_mask = RR >= 2.0
+    high_rr_trades = int(high_rr_mask.sum())
+    excellent_trades = [SHORT_TRADES[i] for i in np.flatnonzero(high_rr_mask)]
     
-    print(f"Total SHORT Trades:           {total_trades}")
-    print(f"Profitable at LOW point:      {profitable_at_low}/{total_trades} ({profitable_at_low/total_trades*100:.1f}%)")
-    print(f"Average Max R:R Ratio:        {avg_max_rr:.2f}:1")
-    print(f"Best R:R Ratio:               {best_rr:.2f}:1  (Trade #{[t['id'] for t in short_trades if t['max_rr_ratio'] == best_rr][0]})")
-    print(f"Worst R:R Ratio:              {worst_rr:.2f}:1  (Trade #{[t['id'] for t in short_trades if t['max_rr_ratio'] == worst_rr][0]})")
-    print(f"High R:R Trades (≥2:1):       {high_rr_trades}/{total_trades} ({high_rr_trades/total_trades*100:.1f}%)")
+    out.append(f"Total SHORT Trades:           {total_trades}")
+    out.append(f"Profitable at LOW point:      {profitable_at_low}/{total_trades} ({profitable_at_low/total_trades*100:.1f}%)")
+    out.append(f"Average Max R:R Ratio:        {avg_max_rr:.2f}:1")
+    out.append(f"Best R:R Ratio:               {best_rr:.2f}:1  (Trade #{SHORT_TRADES[best_idx].id})")
+    out.append(f"Worst R:R Ratio:              {worst_rr:.2f}:1  (Trade #{SHORT_TRADES[worst_idx].id})")
+    out.append(f"High R:R Trades (≥2:1):       {high_rr_trades}/{total_trades} ({high_rr_trades/total_trades*100:.1f}%)")
     
-    print(f"\n🌟 TOP PERFORMING TRADES (R:R ≥ 2:1):")
+    out.append(f"\n🌟 TOP PERFORMING TRADES (R:R ≥ 2:1):")
     for trade in excellent_trades:
-        print(f"   Trade #{trade['id']:2d}: {trade['max_rr_ratio']:.2f}:1 - ${trade['unrealized_pl_low']:+.2f} max profit per 1000 units")
+        out.append(f"   Trade #{trade.id:2d}: {trade.max_rr_ratio:.2f}:1 - ${trade.unrealized_pl_low:+.2f} max profit per 1000 units")
     
-    total_max_profit = sum(trade['unrealized_pl_low'] for trade in short_trades if trade['unrealized_pl_low'] > 0)
-    print(f"\nTotal Potential Profit (if all profitable trades hit LOW): ${total_max_profit:.2f} per 1000 units")
-    print(f"Average Profit per Successful Trade: ${total_max_profit/profitable_at_low:.2f} per 1000 units")
+    total_max_profit = PLL[PLL > 0].sum()
+    out.append(f"\nTotal Potential Profit (if all profitable trades hit LOW): ${total_max_profit:.2f} per 1000 units")
+    out.append(f"Average Profit per Successful Trade: ${total_max_profit/profitable_at_low:.2f} per 1000 units")
     
-    print(f"\n💡 KEY INSIGHTS:")
-    print(f"• {profitable_at_low/total_trades*100:.1f}% of trades were profitable at their lowest point")
-    print(f"• {high_rr_trades/total_trades*100:.1f}% of trades had excellent 2:1+ risk/reward potential")
-    print(f"• Using 1:1 take profit captures most profits reliably")
-    print(f"• Using 2:1 take profit would capture the best moves")
-    print(f"• Market was consistently BEAR - strategy worked perfectly!")
+    out.append(f"\n💡 KEY INSIGHTS:")
+    out.append(f"• {profitable_at_low/total_trades*100:.1f}% of trades were profitable at their lowest point")
+    out.append(f"• {high_rr_trades/total_trades*100:.1f}% of trades had excellent 2:1+ risk/reward potential")
+    out.append(f"• Using 1:1 take profit captures most profits reliably")
+    out.append(f"• Using 2:1 take profit would capture the best moves")
+    out.append(f"• Market was consistently BEAR - strategy worked perfectly!")
+
+    return "\n".join(out) + "\n"
+
+
+# The dataset is static, so the report is too: build it once at import
+_REPORT = build_short_trades_report()
+
+
+def print_all_short_trades():
+    """Print detailed information for all 14 allowed SHORT trades"""
+    sys.stdout.write(_REPORT)
+
 
 if __name__ == "__main__":
-    print_all_short_trades()
\ No newline at end of file
+    print_all_short_trades()
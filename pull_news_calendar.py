@@ -18,10 +18,37 @@ warnings.filterwarnings('ignore', message='urllib3')
 
 import sys
 import os
+import io
+import gzip
+import re
 import json
+import time
+import contextvars
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple, Union
+
+# orjson is optional; fall back to the stdlib json module when missing
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Prefer lxml (libxml2) for parsing the calendar feed, fall back to the stdlib
+try:
+    from lxml import etree as XML_ETREE
+    XML_PARSE_ERROR = XML_ETREE.XMLSyntaxError
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as XML_ETREE
+    XML_PARSE_ERROR = XML_ETREE.ParseError
+    HAVE_LXML = False
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -29,44 +56,178 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.config import OANDAConfig
 
 
+# Shared HTTP session: keep-alive connection pooling, with rate-limit and
+# gateway errors retried with a short backoff by urllib3. Retry-After is not
+# honoured: a server could ask for an arbitrarily long wait, and a stale
+# cache is a better answer than a stalled run.
+# The fetches are overlapped with threads (see main() and
+# fetch_forexfactory_calendar) rather than an async HTTP/2 client, keeping
+# this tool on the same requests stack as the rest of the project.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, status_forcelist=[429, 502, 503, 504], backoff_factor=1.0,
+                      respect_retry_after_header=False)
+))
+
+# (connect, read) timeouts in seconds
+HTTP_TIMEOUT = (3, 15)
+
+# Currencies whose calendar events affect EUR/USD
+ALLOWED_CURRENCIES = frozenset(('USD', 'EUR'))
+
+# Request headers for the Forex Factory XML feeds
+FF_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'application/xml',
+    'Cache-Control': 'no-cache'
+}
+
+
 # Cache directory for storing fetched events
 CACHE_DIR = "backtest/data"
 CACHE_FILE = f"{CACHE_DIR}/news_calendar_cache.json"
+# Cache is written gzip-compressed; the plaintext file is still read as a fallback
+CACHE_FILE_GZ = f"{CACHE_FILE}.gz"
+
+
+# Skip the network entirely when the cache is younger than this
+CACHE_TTL_SECONDS = 3600
+
+
+# Where print() output goes while main() runs the loaders concurrently: the
+# current loader's buffer, or None for straight to the console
+OUTPUT_BUFFER: contextvars.ContextVar = contextvars.ContextVar('output_buffer', default=None)
+
+
+class ContextStdout:
+    """sys.stdout stand-in that writes to the current context's OUTPUT_BUFFER, if any."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = OUTPUT_BUFFER.get()
+        return (self._stream if buffer is None else buffer).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_buffered(func, *args) -> Tuple[object, str]:
+    """
+    Run func(*args) with its printed output collected instead of shown.
+    Returns (result, output). Only effective while sys.stdout is a ContextStdout.
+    """
+    buffer = io.StringIO()
+    token = OUTPUT_BUFFER.set(buffer)
+    try:
+        result = func(*args)
+    finally:
+        OUTPUT_BUFFER.reset(token)
+    return result, buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def run_timestamps() -> Tuple[str, str]:
+    """
+    UTC timestamp strings for this run, formatted once.
+    Returns (ISO 'last_updated' form, human-readable 'cached_at' form).
+    """
+    now = datetime.utcnow()
+    return now.strftime('%Y-%m-%dT%H:%M:%SZ'), now.strftime('%Y-%m-%d %H:%M UTC')
+
+
+def retry_error_cause(error: requests.exceptions.RetryError) -> str:
+    """
+    Why the session gave up retrying, e.g. 'rate limited (429)' or
+    'server error (503)'.
+    """
+    # requests wraps urllib3's MaxRetryError, whose reason names the last status
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    match = re.search(r'too many (\d{3}) error responses', str(reason or error))
+    if not match:
+        return str(reason or error)
+    status = match.group(1)
+    return f"rate limited ({status})" if status == '429' else f"server error ({status})"
+
+
+def dump_json_bytes(data: Dict) -> bytes:
+    """Encode data as indented JSON bytes, using orjson when available."""
+    if HAVE_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def load_json_file(filepath: str):
+    """Read and decode a JSON file (.gz is decompressed), using orjson when available."""
+    opener = gzip.open if filepath.endswith('.gz') else open
+    with opener(filepath, 'rb') as f:
+        raw = f.read()
+    if HAVE_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_cache() -> Dict:
+    """Read the raw cache file (events plus HTTP validators), or {} if unavailable."""
+    for cache_path in (CACHE_FILE_GZ, CACHE_FILE):
+        if not os.path.exists(cache_path):
+            continue
+        try:
+            return load_json_file(cache_path)
+        except Exception as e:
+            continue
+    return {}
 
 
 def load_cache() -> List[Dict]:
     """Load cached events from previous fetch."""
-    if not os.path.exists(CACHE_FILE):
-        return []
-    try:
-        with open(CACHE_FILE, 'r') as f:
-            data = json.load(f)
-        events = data.get('events', [])
-        cached_time = data.get('cached_at', 'unknown')
-        if events:
-            print(f"  Loaded {len(events)} cached events (from {cached_time})")
-        return events
-    except Exception as e:
-        return []
+    data = read_cache()
+    events = data.get('events', [])
+    cached_time = data.get('cached_at', 'unknown')
+    if events:
+        print(f"  Loaded {len(events)} cached events (from {cached_time})")
+    return events
 
 
-def save_cache(events: List[Dict]):
-    """Save events to cache file."""
+def save_cache(events: List[Dict], etag: Optional[str] = None,
+               last_modified: Optional[str] = None, days: Optional[int] = None,
+               this_week_count: Optional[int] = None):
+    """
+    Save events to cache file, along with this week's feed ETag/Last-Modified
+    validators. The first this_week_count events came from this week's feed,
+    the rest from next week's.
+    """
     if not events:
         return
     try:
         os.makedirs(CACHE_DIR, exist_ok=True)
         cache_data = {
             'events': events,
-            'cached_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'),
-            'count': len(events)
+            'cached_at': run_timestamps()[1],
+            'count': len(events),
+            'etag': etag,
+            'last_modified': last_modified,
+            'days': days,
+            'this_week_count': this_week_count
         }
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        with gzip.open(CACHE_FILE_GZ, 'wb') as f:
+            f.write(dump_json_bytes(cache_data))
     except Exception as e:
         pass
 
 
+def cache_age_seconds(cache: Dict) -> Optional[float]:
+    """Age of the cache in seconds, or None if unknown."""
+    try:
+        cached_at = datetime.strptime(cache['cached_at'], '%Y-%m-%d %H:%M UTC')
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (datetime.utcnow() - cached_at).total_seconds()
+
+
 # High-impact event keywords
 HIGH_IMPACT_KEYWORDS = [
     'FOMC', 'Fed', 'Federal Reserve', 'Interest Rate', 'ECB', 'Bank of England', 'BOE',
@@ -97,7 +258,7 @@ def fetch_oanda_calendar(days: int = 14) -> List[Dict]:
         }
 
         print(f"Fetching from OANDA ForexLabs API...")
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = SESSION.get(url, headers=headers, params=params, timeout=(3, 10))
         response.raise_for_status()
 
         events = response.json()
@@ -120,153 +281,217 @@ def fetch_forexfactory_calendar(days: int = 14) -> List[Dict]:
     Fetch calendar from Forex Factory XML feed.
     This is a publicly accessible feed.
     """
-    import time
+    # Cached validators are only usable if the cache covers the requested range
+    # and its this-week events can be told apart from next week's. Caches
+    # without this_week_count only qualify if they never held next week's feed.
+    cache = read_cache()
+    cached_events = cache.get('events') or []
+    cached_days = cache.get('days') or 0
+    this_week_count = cache.get('this_week_count')
+    if this_week_count is None and cached_days <= 7:
+        this_week_count = len(cached_events)
+    cache_usable = bool(cached_events) and cached_days >= days and this_week_count is not None
+
+    if cache_usable:
+        age = cache_age_seconds(cache)
+        if age is not None and 0 <= age < CACHE_TTL_SECONDS:
+            print(f"Using cached Forex Factory data ({int(age // 60)} min old)")
+            return load_cache()
+
+    # The validators only cover this week's feed, so next week's is always
+    # downloaded; fetch it concurrently with this week's
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_week = None
+        if days > 7:
+            # Run in a copy of this context so any output joins this loader's
+            next_week = executor.submit(contextvars.copy_context().run, fetch_forexfactory_nextweek, days)
 
+        try:
+            print(f"Fetching from Forex Factory...")
+
+            # Forex Factory provides weekly XML feeds
+            # We'll fetch current week and next weeks as needed
+            url = "https://nfs.faireconomy.media/ff_calendar_thisweek.xml"
+
+            # Conditional request: server answers 304 if the feed is unchanged
+            request_headers = dict(FF_HEADERS)
+            if cache_usable:
+                if cache.get('etag'):
+                    request_headers['If-None-Match'] = cache['etag']
+                if cache.get('last_modified'):
+                    request_headers['If-Modified-Since'] = cache['last_modified']
+
+            # Rate limiting (429) and gateway errors are retried with backoff
+            # by the session adapter
+            try:
+                response = SESSION.get(url, headers=request_headers, timeout=HTTP_TIMEOUT)
+            except requests.exceptions.RetryError as e:
+                print(f"  Forex Factory {retry_error_cause(e)} - using cached data")
+                return load_cache()  # Return cached data once retries run out
+
+            if response.status_code == 304:
+                # Only this week's events are known to be current
+                print(f"  Forex Factory feed unchanged - reusing cached events for this week")
+                events = cached_events[:this_week_count]
+                etag, last_modified = cache.get('etag'), cache.get('last_modified')
+            elif response.status_code != 200:
+                print(f"  Forex Factory returned status {response.status_code}")
+                return load_cache()  # Return cached data on error
+            else:
+                events = parse_forexfactory_xml(response.content, days)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            this_week_count = len(events)
+
+            # Also add next week's data if looking beyond 7 days
+            if next_week is not None:
+                events.extend(next_week.result())
+
+            print(f"  Fetched {len(events)} high-impact events from Forex Factory")
+
+            # Save to cache for future rate-limit fallback; this also
+            # restarts the TTL window after a 304
+            if events:
+                save_cache(events, etag=etag, last_modified=last_modified,
+                           days=days, this_week_count=this_week_count)
+
+            return events
+
+        except Exception as e:
+            print(f"  Failed to fetch from Forex Factory: {e}")
+            return load_cache()  # Return cached data on error
+
+
+def fetch_forexfactory_nextweek(days: int = 14) -> List[Dict]:
+    """Fetch next week's Forex Factory feed. Best effort: errors yield no events."""
     try:
-        print(f"Fetching from Forex Factory...")
+        url_next = "https://nfs.faireconomy.media/ff_calendar_nextweek.xml"
+        response_next = SESSION.get(url_next, headers=FF_HEADERS, timeout=HTTP_TIMEOUT)
+        if response_next.status_code == 200:
+            return parse_forexfactory_xml(response_next.content, days)
+    except:
+        pass
+    return []
 
-        # Forex Factory provides weekly XML feeds
-        # We'll fetch current week and next weeks as needed
-        url = "https://nfs.faireconomy.media/ff_calendar_thisweek.xml"
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'application/xml',
-            'Cache-Control': 'no-cache'
-        }
+def iter_event_elements(xml_data: bytes) -> Iterator:
+    """
+    Stream <event> elements from the feed without building the full tree.
+    Each element is cleared once the caller has consumed it.
+    """
+    if HAVE_LXML:
+        context = XML_ETREE.iterparse(io.BytesIO(xml_data), tag='event')
+    else:
+        context = XML_ETREE.iterparse(io.BytesIO(xml_data))
 
-        # Retry logic for rate limiting
-        max_retries = 2
-        for attempt in range(max_retries):
-            response = requests.get(url, headers=headers, timeout=15)
-
-            if response.status_code == 200:
-                break
-            elif response.status_code == 429:
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    print(f"  Rate limited, waiting {wait_time}s...")
-                    time.sleep(wait_time)
-            else:
-                print(f"  Forex Factory returned status {response.status_code}")
-                return load_cache()  # Return cached data on error
-        else:
-            print(f"  Forex Factory rate limited - using cached data")
-            return load_cache()  # Return cached data on rate limit
+    for _, elem in context:
+        if elem.tag != 'event':
+            continue
+        yield elem
+        elem.clear()
 
-        events = parse_forexfactory_xml(response.text, days)
 
-        # Also try next week's data if looking beyond 7 days
-        if days > 7:
-            try:
-                url_next = "https://nfs.faireconomy.media/ff_calendar_nextweek.xml"
-                response_next = requests.get(url_next, headers=headers, timeout=15)
-                if response_next.status_code == 200:
-                    events_next = parse_forexfactory_xml(response_next.text, days)
-                    events.extend(events_next)
-            except:
-                pass
+def parse_event_fields(fields: Dict, now: datetime, end_time: datetime) -> Optional[Dict]:
+    """
+    Convert one feed <event>'s child fields into an event dict.
+    Returns None unless it is a high-impact USD/EUR event within [now, end_time].
+    """
+    # Cheapest rejections first: most feed events are not
+    # high impact or not USD/EUR, so skip them before any parsing
+    impact_text = fields.get('impact')
+    if impact_text is None or impact_text.lower() != 'high':
+        return None
 
-        print(f"  Fetched {len(events)} high-impact events from Forex Factory")
+    currency_text = fields.get('country')
+    if currency_text not in ALLOWED_CURRENCIES:
+        return None
 
-        # Save to cache for future rate-limit fallback
-        if events:
-            save_cache(events)
+    if 'title' not in fields:
+        return None
+    title_text = fields['title'] or ''
 
-        return events
+    # Parse date and time
+    date_text = fields.get('date') or ''
+    time_text = fields.get('time') or ''
+
+    if not date_text:
+        return None
+
+    # Handle "All Day" events
+    if not time_text or time_text.lower() == 'all day':
+        time_text = '12:00am'
+
+    # Parse datetime (format: "01-15-2026" and "8:30am")
+    try:
+        # Cheap date-only range check before parsing the time
+        event_date = datetime.strptime(date_text, '%m-%d-%Y')
+        if event_date.date() < now.date() or event_date > end_time:
+            return None
+
+        # Clean up time format and pick the matching format directly
+        time_text = time_text.replace(' ', '').lower()
+        if 'am' in time_text or 'pm' in time_text:
+            fmt = '%m-%d-%Y %I:%M%p'
+        else:
+            fmt = '%m-%d-%Y %H:%M'
+
+        try:
+            dt = datetime.strptime(f"{date_text} {time_text}", fmt)
+        except ValueError:
+            # If the time is unparseable, fall back to just the date
+            dt = event_date
+
+        # Check if within range
+        if dt < now or dt > end_time:
+            return None
+
+        return {
+            'title': title_text,
+            'timestamp': int(dt.timestamp()),
+            'currency': currency_text,
+            'impact': 3,
+            'source': 'forexfactory'
+        }
 
     except Exception as e:
-        print(f"  Failed to fetch from Forex Factory: {e}")
-        return load_cache()  # Return cached data on error
+        return None
 
 
-def parse_forexfactory_xml(xml_text: str, days: int = 14) -> List[Dict]:
+def iter_forexfactory_events(xml_data: bytes, days: int = 14) -> Iterator[Dict]:
+    """
+    Stream high-impact USD/EUR events from the feed as they are parsed.
+    XML syntax errors propagate to the caller.
+    """
+    now = datetime.utcnow()
+    end_time = now + timedelta(days=days)
+
+    for event_elem in iter_event_elements(xml_data):
+        try:
+            # Read all child fields in a single pass
+            fields = {child.tag: child.text for child in event_elem}
+            event = parse_event_fields(fields, now, end_time)
+        except Exception as e:
+            continue
+        if event is not None:
+            yield event
+
+
+def parse_forexfactory_xml(xml_text: Union[str, bytes], days: int = 14) -> List[Dict]:
     """
     Parse Forex Factory XML calendar feed.
     Returns list of high-impact events for USD/EUR.
+
+    Pass the raw response bytes when possible so the feed's declared
+    encoding is honoured.
     """
-    import re
-    import xml.etree.ElementTree as ET
+    xml_data = xml_text.encode('utf-8') if isinstance(xml_text, str) else xml_text
 
+    # Let list.extend size the list from the stream; events parsed before
+    # a syntax error are kept
     events = []
-    now = datetime.utcnow()
-    end_time = now + timedelta(days=days)
-
     try:
-        root = ET.fromstring(xml_text)
-
-        for event_elem in root.findall('.//event'):
-            try:
-                title = event_elem.find('title')
-                currency = event_elem.find('country')
-                impact = event_elem.find('impact')
-                date_elem = event_elem.find('date')
-                time_elem = event_elem.find('time')
-
-                if title is None or currency is None or impact is None:
-                    continue
-
-                title_text = title.text or ''
-                currency_text = currency.text or ''
-                impact_text = (impact.text or '').lower()
-
-                # Only high impact events
-                if impact_text != 'high':
-                    continue
-
-                # Only USD and EUR
-                if currency_text not in ['USD', 'EUR']:
-                    continue
-
-                # Parse date and time
-                date_text = date_elem.text if date_elem is not None else ''
-                time_text = time_elem.text if time_elem is not None else ''
-
-                if not date_text:
-                    continue
-
-                # Handle "All Day" events
-                if not time_text or time_text.lower() == 'all day':
-                    time_text = '12:00am'
-
-                # Parse datetime (format: "01-15-2026" and "8:30am")
-                try:
-                    # Clean up time format
-                    time_text = time_text.replace(' ', '').lower()
-                    datetime_str = f"{date_text} {time_text}"
-
-                    # Try different formats
-                    for fmt in ['%m-%d-%Y %I:%M%p', '%m-%d-%Y %H:%M']:
-                        try:
-                            dt = datetime.strptime(datetime_str, fmt)
-                            break
-                        except:
-                            continue
-                    else:
-                        # If no format worked, try just the date
-                        dt = datetime.strptime(date_text, '%m-%d-%Y')
-
-                    # Check if within range
-                    if dt < now or dt > end_time:
-                        continue
-
-                    timestamp = int(dt.timestamp())
-
-                    events.append({
-                        'title': title_text,
-                        'timestamp': timestamp,
-                        'currency': currency_text,
-                        'impact': 3,
-                        'source': 'forexfactory'
-                    })
-
-                except Exception as e:
-                    continue
-
-            except Exception as e:
-                continue
-
-    except ET.ParseError as e:
+        events.extend(iter_forexfactory_events(xml_data, days))
+    except XML_PARSE_ERROR as e:
         print(f"  XML parse error: {e}")
 
     return events
@@ -281,8 +506,7 @@ def load_manual_events(account: str = 'account1') -> List[Dict]:
         return []
 
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = load_json_file(filepath)
 
         events = data.get('events', [])
         # Add source marker
@@ -297,40 +521,72 @@ def load_manual_events(account: str = 'account1') -> List[Dict]:
         return []
 
 
-def filter_events(events: List[Dict], days: int = 14) -> List[Dict]:
+def filter_events(events: Iterable[Dict], days: int = 14) -> List[Dict]:
     """
-    Filter events to high-impact only within date range.
+    Filter events to high-impact only within date range, dropping duplicates
+    (same title + timestamp; the first occurrence wins).
+    Returns the unique events sorted by timestamp.
     """
-    now = datetime.utcnow()
-    end_time = now + timedelta(days=days)
+    now_ts = time.time()
+    end_ts = now_ts + days * 86400
 
-    filtered = []
+    # Single pass: range check, impact check and dedupe together
+    unique = {}
     for event in events:
-        try:
-            # Check timestamp is in range
-            timestamp = event.get('timestamp', 0)
-            event_time = datetime.utcfromtimestamp(timestamp)
-
-            if now <= event_time <= end_time:
-                # Check impact level
-                impact = event.get('impact', 0)
-                if impact >= 2:  # Medium and High impact
-                    filtered.append(event)
-        except:
+        timestamp = event.get('timestamp', 0)
+        if not isinstance(timestamp, (int, float)) or not now_ts <= timestamp <= end_ts:
             continue
 
-    # Sort by timestamp
-    filtered.sort(key=lambda x: x.get('timestamp', 0))
-    return filtered
+        # Medium and High impact
+        impact = event.get('impact', 0)
+        if not isinstance(impact, (int, float)) or impact < 2:
+            continue
 
+        unique.setdefault((event.get('title', ''), timestamp), event)
 
-def display_events(events: List[Dict], title: str = "Economic Calendar"):
-    """Display events in a formatted table."""
+    return sorted(unique.values(), key=itemgetter('timestamp'))
+
+
+def pacific_timezone():
+    """Return the US/Pacific tzinfo (zoneinfo preferred, pytz fallback), or None."""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo('America/Los_Angeles')
+    except Exception:
+        pass
     try:
         import pytz
-        pt_tz = pytz.timezone('America/Los_Angeles')
+        return pytz.timezone('America/Los_Angeles')
     except ImportError:
-        pt_tz = None
+        return None
+
+
+def fixed_utc_offset(tz, timestamps: List[float]) -> Optional[timedelta]:
+    """
+    Return tz's UTC offset if it is the same for every timestamp, else None.
+
+    DST changes are months apart, so when the first and last timestamps of a
+    window shorter than 90 days share an offset, nothing in between differs.
+    """
+    try:
+        lo, hi = min(timestamps), max(timestamps)
+        if hi - lo > 90 * 86400:
+            return None
+        offset_lo = datetime.fromtimestamp(lo, timezone.utc).astimezone(tz).utcoffset()
+        offset_hi = datetime.fromtimestamp(hi, timezone.utc).astimezone(tz).utcoffset()
+    except Exception:
+        return None
+    return offset_lo if offset_lo == offset_hi else None
+
+
+def display_events(events: List[Dict], title: str = "Economic Calendar"):
+    """Display events in a formatted table."""
+    pt_tz = pacific_timezone()
+
+    # Convert with one precomputed offset unless the events straddle a DST change
+    pt_offset = None
+    if pt_tz and events:
+        pt_offset = fixed_utc_offset(pt_tz, [e.get('timestamp', 0) for e in events])
 
     print("\n" + "=" * 90)
     print(f"  {title}")
@@ -351,10 +607,10 @@ def display_events(events: List[Dict], title: str = "Economic Calendar"):
             dt_utc = datetime.utcfromtimestamp(timestamp)
 
             # Convert to Pacific Time
-            if pt_tz:
-                import pytz
-                dt_utc_tz = dt_utc.replace(tzinfo=pytz.UTC)
-                dt_pt = dt_utc_tz.astimezone(pt_tz)
+            if pt_offset is not None:
+                date_str = (dt_utc + pt_offset).strftime('%m/%d %H:%M PT')
+            elif pt_tz:
+                dt_pt = dt_utc.replace(tzinfo=timezone.utc).astimezone(pt_tz)
                 date_str = dt_pt.strftime('%m/%d %H:%M PT')
             else:
                 date_str = dt_utc.strftime('%Y-%m-%d %H:%M')
@@ -388,23 +644,22 @@ def export_events(events: List[Dict], account: str = 'account1'):
 
     # Prepare export data
     export_data = {
-        'events': [],
-        'last_updated': datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'events': [
+            {
+                'title': event.get('title', 'Unknown'),
+                'timestamp': event.get('timestamp', 0),
+                'currency': event.get('currency', 'USD'),
+                'impact': event.get('impact', 3)
+            }
+            for event in events
+        ],
+        'last_updated': run_timestamps()[0],
         '_generated_by': 'pull_news_calendar.py'
     }
 
-    for event in events:
-        export_event = {
-            'title': event.get('title', 'Unknown'),
-            'timestamp': event.get('timestamp', 0),
-            'currency': event.get('currency', 'USD'),
-            'impact': event.get('impact', 3)
-        }
-        export_data['events'].append(export_event)
-
     # Write to file
-    with open(filepath, 'w') as f:
-        json.dump(export_data, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(dump_json_bytes(export_data))
 
     print(f"\n  Exported {len(events)} events to {filepath}")
 
@@ -473,22 +728,33 @@ def main():
 
     all_events = []
 
-    # Fetch from sources based on selection
-    if source in ['all', 'oanda']:
-        oanda_events = fetch_oanda_calendar(days)
-        all_events.extend(oanda_events)
+    # Fetch from sources based on selection. Network fetches run concurrently;
+    # results are merged in submission order so dedupe precedence is stable,
+    # and each source's progress output is held back and printed in that
+    # same order so lines from different sources don't interleave.
+    console = sys.stdout
+    sys.stdout = ContextStdout(console)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = []
+            if source in ['all', 'oanda']:
+                futures.append(executor.submit(run_buffered, fetch_oanda_calendar, days))
+
+            if source in ['all', 'forexfactory', 'ff']:
+                futures.append(executor.submit(run_buffered, fetch_forexfactory_calendar, days))
 
-    if source in ['all', 'forexfactory', 'ff']:
-        ff_events = fetch_forexfactory_calendar(days)
-        all_events.extend(ff_events)
+            if source in ['all', 'manual']:
+                futures.append(executor.submit(run_buffered, load_manual_events, account))
 
-    if source in ['all', 'manual']:
-        manual_events = load_manual_events(account)
-        all_events.extend(manual_events)
+            if source == 'sample':
+                futures.append(executor.submit(run_buffered, generate_sample_events, days))
 
-    if source == 'sample':
-        sample_events = generate_sample_events(days)
-        all_events.extend(sample_events)
+            for future in futures:
+                events, output = future.result()
+                console.write(output)
+                all_events.extend(events)
+    finally:
+        sys.stdout = console
 
     # If no events found, offer sample generation
     if not all_events and source == 'all':
@@ -496,17 +762,8 @@ def main():
         print("  Generating sample events for demonstration...")
         all_events = generate_sample_events(days)
 
-    # Filter and deduplicate events
-    filtered_events = filter_events(all_events, days)
-
-    # Remove duplicates based on title + timestamp
-    seen = set()
-    unique_events = []
-    for event in filtered_events:
-        key = (event.get('title', ''), event.get('timestamp', 0))
-        if key not in seen:
-            seen.add(key)
-            unique_events.append(event)
+    # Filter, deduplicate and sort events in one pass
+    unique_events = filter_events(all_events, days)
 
     # Display events
     display_events(unique_events, f"Economic Calendar - Next {days} Days")
@@ -15,15 +15,45 @@ Usage:
     python3 set_take_profit.py rr=1.5
 """
 
+import copy
 import requests
 import json
 import sys
 import yaml
 import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 sys.path.insert(0, 'src')
 from config import OANDAConfig
 
+# orjson is optional; fall back to the stdlib json module when missing
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+
+def encode_json(data):
+    """Encode a request payload as JSON bytes, using orjson when available"""
+    if HAVE_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def decode_response(response):
+    """Decode a JSON response body, using orjson when available"""
+    if HAVE_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Parsed R:R configs keyed by path, invalidated when the file's stat signature changes
+_RR_CACHE = {}
+
 
 def load_rr_config(account):
     """Load R:R config from account config or defaults"""
@@ -35,31 +65,78 @@ def load_rr_config(account):
 
     # Try to load from account config
     account_config_path = f"{account}/config.yaml"
-    if os.path.exists(account_config_path):
-        try:
-            with open(account_config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                if config and 'risk_reward' in config:
-                    rr_config = config['risk_reward']
-                    # Merge with defaults
-                    for market in ['bear_market', 'bull_market']:
-                        if market in rr_config:
-                            default_rr[market].update(rr_config[market])
-        except Exception:
-            pass
-
-    return default_rr
-
-
-def get_open_trades(base_url, headers, account_id):
+    try:
+        st = os.stat(account_config_path)
+    except OSError:
+        return default_rr
+
+    # Reuse the parsed config while the file is unchanged (st_ino catches atomic replaces)
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _RR_CACHE.get(account_config_path)
+    if cached is not None and cached[0] == sig:
+        return copy.deepcopy(cached[1])
+
+    try:
+        with open(account_config_path, 'r') as f:
+            config = yaml.safe_load(f)
+            if config and 'risk_reward' in config:
+                rr_config = config['risk_reward']
+                # Merge with defaults
+                for market in ['bear_market', 'bull_market']:
+                    if market in rr_config:
+                        default_rr[market].update(rr_config[market])
+    except Exception:
+        pass
+
+    _RR_CACHE[account_config_path] = (sig, default_rr)
+    return copy.deepcopy(default_rr)
+
+
+class OrderRetry(Retry):
+    """
+    Retry policy that also covers order POSTs, but only where OANDA cannot
+    have acted on them: connection failures (retried for every method) and
+    429/503 responses. Other POST failures are not retried, so an order that
+    may have been accepted is never sent twice.
+    """
+
+    POST_RETRY_STATUSES = frozenset((429, 503))
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == 'POST':
+            return bool(self.total) and status_code in self.POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def create_session(headers):
+    """Create a keep-alive session carrying the OANDA auth headers"""
+    session = requests.Session()
+    session.headers.update(headers)
+    # Payloads are sent pre-encoded, so the content type must be set explicitly
+    session.headers['Content-Type'] = 'application/json'
+    # Rate-limit and server errors are retried with exponential backoff
+    # (api_retry_delay * 2**n) by urllib3 inside the calling worker; once
+    # retries run out the last response is returned for raise_for_status().
+    # Order POSTs are retried more narrowly, see OrderRetry.
+    retry = OrderRetry(
+        total=OANDAConfig.api_max_retries,
+        status_forcelist=[429, 500, 502, 503, 504],
+        backoff_factor=OANDAConfig.api_retry_delay,
+        raise_on_status=False
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+    return session
+
+
+def get_open_trades(base_url, session, account_id):
     """Fetch open trades with SL/TP details"""
     url = f"{base_url}/v3/accounts/{account_id}/openTrades"
-    response = requests.get(url, headers=headers, timeout=10)
+    response = session.get(url, timeout=10)
     response.raise_for_status()
-    return response.json()
+    return decode_response(response)
 
 
-def create_take_profit_order(base_url, headers, account_id, trade_id, price):
+def create_take_profit_order(base_url, session, account_id, trade_id, price):
     """Create a new take profit order for a trade"""
     url = f"{base_url}/v3/accounts/{account_id}/orders"
     order_data = {
@@ -70,12 +147,12 @@ def create_take_profit_order(base_url, headers, account_id, trade_id, price):
             "timeInForce": "GTC"
         }
     }
-    response = requests.post(url, headers=headers, json=order_data, timeout=10)
+    response = session.post(url, data=encode_json(order_data), timeout=10)
     response.raise_for_status()
-    return response.json()
+    return decode_response(response)
 
 
-def update_take_profit_order(base_url, headers, account_id, order_id, trade_id, price):
+def update_take_profit_order(base_url, session, account_id, order_id, trade_id, price):
     """Update an existing take profit order"""
     url = f"{base_url}/v3/accounts/{account_id}/orders/{order_id}"
     order_data = {
@@ -86,29 +163,104 @@ def update_take_profit_order(base_url, headers, account_id, order_id, trade_id,
             "timeInForce": "GTC"
         }
     }
-    response = requests.put(url, headers=headers, json=order_data, timeout=10)
+    response = session.put(url, data=encode_json(order_data), timeout=10)
     response.raise_for_status()
-    return response.json()
+    return decode_response(response)
+
+
+def set_trade_take_profit(base_url, session, account_id, trade_id, tp_order_id, price):
+    """Update the trade's TP order if it has one, otherwise create it
+
+    Returns:
+        tuple: ('UPDATED' or 'CREATED', API response)
+    """
+    if tp_order_id:
+        return 'UPDATED', update_take_profit_order(
+            base_url, session, account_id,
+            tp_order_id, trade_id, price
+        )
+    return 'CREATED', create_take_profit_order(
+        base_url, session, account_id,
+        trade_id, price
+    )
+
+
+_TRADE_FIELDS = itemgetter('id', 'instrument', 'price', 'currentUnits', 'unrealizedPL')
+
+
+def _order_price(order):
+    """Return (price, id) of an attached SL/TP order, or (None, None)"""
+    return (float(order['price']), order['id']) if order else (None, None)
+
+
+def parse_trade(trade):
+    """Extract the fields shown and used for TP calculation from an open trade"""
+    trade_id, instrument, entry_price, current_units, unrealized_pl = _TRADE_FIELDS(trade)
+    current_units = float(current_units)
+    sl_price, _ = _order_price(trade.get('stopLossOrder'))
+    tp_price, tp_order_id = _order_price(trade.get('takeProfitOrder'))
+    return {
+        'trade_id': trade_id,
+        'instrument': instrument,
+        'entry_price': float(entry_price),
+        'current_units': current_units,
+        'unrealized_pl': float(unrealized_pl),
+        'sl_price': sl_price,
+        'tp_price': tp_price,
+        'tp_order_id': tp_order_id,
+        'position_type': 'LONG' if current_units > 0 else 'SHORT',
+    }
+
+
+def get_rr_ratio(position_type, rr_config, custom_rr=None):
+    """Get R:R ratio from config or custom"""
+    if custom_rr is not None:
+        return custom_rr
+    if position_type == 'SHORT':
+        return rr_config['bear_market']['short_rr']
+    return rr_config['bull_market']['long_rr']
+
+
+def calculate_rr_take_profit(entry_price, sl_price, position_type, rr_ratio):
+    """Calculate TP based on R:R, returns (take_profit, reward)"""
+    risk = abs(entry_price - sl_price)
+    reward = risk * rr_ratio
+    if position_type == 'LONG':
+        return entry_price + reward, reward
+    return entry_price - reward, reward
+
+
+# key=value command-line options: key -> (option name, value parser)
+ARG_PARSERS = {
+    'take_profit_price': ('take_profit_price', float),
+    'rr': ('custom_rr', float),
+}
 
 
 def main():
     # Parse arguments
-    account = 'account1'
-    take_profit_price = None
-    custom_rr = None
+    options = {'account': 'account1', 'take_profit_price': None, 'custom_rr': None}
 
     for arg in sys.argv[1:]:
-        if arg.startswith('take_profit_price='):
-            take_profit_price = float(arg.split('=')[1])
-        elif arg.startswith('rr='):
-            custom_rr = float(arg.split('=')[1])
-        elif not arg.startswith('-') and '=' not in arg:
-            account = arg
+        if '=' in arg:
+            key, value = arg.split('=', 1)
+            spec = ARG_PARSERS.get(key)
+            if spec:
+                options[spec[0]] = spec[1](value)
+        elif not arg.startswith('-'):
+            options['account'] = arg
+
+    account = options['account']
+    take_profit_price = options['take_profit_price']
+    custom_rr = options['custom_rr']
 
     OANDAConfig.set_account(account)
-    base_url = OANDAConfig.get_base_url()
-    headers = OANDAConfig.get_headers()
-    account_id = OANDAConfig.account_id
+    ctx = OANDAConfig.get_ctx()
+    base_url = ctx.base_url
+    account_id = ctx.account_id
+
+    # One session so every request reuses the same TCP/TLS connection
+    session = create_session(ctx.headers)
 
     # Load R:R config
     rr_config = load_rr_config(account)
@@ -118,7 +270,7 @@ def main():
     print(f"{'=' * 60}")
 
     # Fetch open trades
-    trades_data = get_open_trades(base_url, headers, account_id)
+    trades_data = get_open_trades(base_url, session, account_id)
     trades = trades_data.get('trades', [])
 
     if not trades:
@@ -127,33 +279,44 @@ def main():
 
     print(f"\nFound {len(trades)} open trade(s):\n")
 
-    for trade in trades:
-        trade_id = trade['id']
-        instrument = trade['instrument']
-        entry_price = float(trade['price'])
-        current_units = float(trade['currentUnits'])
-        unrealized_pl = float(trade['unrealizedPL'])
-
-        # Get stop loss info
-        sl_order = trade.get('stopLossOrder')
-        sl_price = float(sl_order['price']) if sl_order else None
-        sl_order_id = sl_order['id'] if sl_order else None
-
-        # Get take profit info
-        tp_order = trade.get('takeProfitOrder')
-        tp_price = float(tp_order['price']) if tp_order else None
-        tp_order_id = tp_order['id'] if tp_order else None
-
-        # Determine position type
-        position_type = 'LONG' if current_units > 0 else 'SHORT'
-
-        print(f"Trade ID:        {trade_id}")
-        print(f"Instrument:      {instrument}")
-        print(f"Position:        {position_type} ({current_units:,.0f} units)")
-        print(f"Entry Price:     {entry_price:.5f}")
-        print(f"Unrealized P/L:  ${unrealized_pl:.2f}")
-        print(f"Stop Loss:       {sl_price:.5f}" if sl_price else "Stop Loss:       NOT SET")
-        print(f"Take Profit:     {tp_price:.5f}" if tp_price else "Take Profit:     NOT SET")
+    parsed_trades = [parse_trade(trade) for trade in trades]
+
+    # Send the independent TP updates concurrently; results are reported in trade order below
+    tp_futures = {}
+    executor = ThreadPoolExecutor(max_workers=4)
+    for t in parsed_trades:
+        tp_to_set = take_profit_price
+        if tp_to_set is None and custom_rr is not None and t['sl_price'] is not None:
+            tp_to_set, _ = calculate_rr_take_profit(
+                t['entry_price'], t['sl_price'], t['position_type'], custom_rr
+            )
+        if tp_to_set is not None:
+            tp_futures[t['trade_id']] = (tp_to_set, executor.submit(
+                set_trade_take_profit, base_url, session, account_id,
+                t['trade_id'], t['tp_order_id'], tp_to_set
+            ))
+    executor.shutdown(wait=False)
+
+    for t in parsed_trades:
+        trade_id = t['trade_id']
+        instrument = t['instrument']
+        entry_price = t['entry_price']
+        current_units = t['current_units']
+        unrealized_pl = t['unrealized_pl']
+        sl_price = t['sl_price']
+        tp_price = t['tp_price']
+        position_type = t['position_type']
+
+        # Trade summary in a single write
+        sys.stdout.write(
+            f"Trade ID:        {trade_id}\n"
+            f"Instrument:      {instrument}\n"
+            f"Position:        {position_type} ({current_units:,.0f} units)\n"
+            f"Entry Price:     {entry_price:.5f}\n"
+            f"Unrealized P/L:  ${unrealized_pl:.2f}\n"
+            + (f"Stop Loss:       {sl_price:.5f}\n" if sl_price else "Stop Loss:       NOT SET\n")
+            + (f"Take Profit:     {tp_price:.5f}\n" if tp_price else "Take Profit:     NOT SET\n")
+        )
 
         # Calculate TP based on R:R if SL exists
         calculated_tp = None
@@ -162,20 +325,12 @@ def main():
             risk_pips = abs(entry_price - sl_price) / 0.0001
 
             # Get R:R ratio from config or custom
-            if custom_rr is not None:
-                rr_ratio = custom_rr
-            elif position_type == 'SHORT':
-                rr_ratio = rr_config['bear_market']['short_rr']
-            else:
-                rr_ratio = rr_config['bull_market']['long_rr']
+            rr_ratio = get_rr_ratio(position_type, rr_config, custom_rr)
 
             # Calculate TP based on R:R
-            risk = abs(entry_price - sl_price)
-            reward = risk * rr_ratio
-            if position_type == 'LONG':
-                calculated_tp = entry_price + reward
-            else:
-                calculated_tp = entry_price - reward
+            calculated_tp, reward = calculate_rr_take_profit(
+                entry_price, sl_price, position_type, rr_ratio
+            )
 
             reward_pips = reward / 0.0001
 
@@ -196,31 +351,17 @@ def main():
 
         print(f"{'-' * 60}")
 
-        # Determine which TP price to set
-        tp_to_set = take_profit_price if take_profit_price is not None else (calculated_tp if custom_rr is not None else None)
-
         # Update take profit if requested (either by take_profit_price= or rr=)
-        if tp_to_set is not None:
+        if trade_id in tp_futures:
+            tp_to_set, tp_future = tp_futures[trade_id]
             if custom_rr is not None:
                 print(f"\n>>> Setting Take Profit to {tp_to_set:.5f} (R:R={custom_rr})...")
             else:
                 print(f"\n>>> Setting Take Profit to {tp_to_set:.5f}...")
 
             try:
-                if tp_order_id:
-                    # Update existing TP order
-                    result = update_take_profit_order(
-                        base_url, headers, account_id,
-                        tp_order_id, trade_id, tp_to_set
-                    )
-                    print(f"✅ Take Profit UPDATED successfully!")
-                else:
-                    # Create new TP order
-                    result = create_take_profit_order(
-                        base_url, headers, account_id,
-                        trade_id, tp_to_set
-                    )
-                    print(f"✅ Take Profit CREATED successfully!")
+                action, result = tp_future.result()
+                print(f"✅ Take Profit {action} successfully!")
 
                 # Show the result
                 if 'takeProfitOrderTransaction' in result:
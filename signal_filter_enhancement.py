@@ -8,6 +8,92 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+# Numba is optional: without it the helpers below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _validate_njit(trend_arr, close_arr, atr_arr, cur_trend, signal_code, lookback,
+                   price, support, resistance, pass_threshold):
+    """
+    Compute the four enhanced_signal_filter validations on raw arrays.
+
+    signal_code is 1 for BUY, -1 for SELL (0 otherwise); support/resistance
+    of 0.0 mean "not available". Checks run cheapest-first (trend,
+    volatility, momentum, S/R) and stop as soon as the remaining ones can
+    no longer lift the score to pass_threshold.
+
+    Returns:
+        int8 array: [trend_strength, price_momentum, volatility_check, support_resistance]
+                    with 1 = passed, 0 = failed, -1 = skipped
+    """
+    result = np.full(4, -1, dtype=np.int8)
+    n = trend_arr.shape[0]
+    current_idx = n - 1
+    passed = 0
+
+    # 1. Trend strength: share of the previous bars in the signal's trend
+    ok = False
+    if current_idx >= lookback and lookback > 0:
+        matches = 0
+        for i in range(current_idx - lookback, current_idx):
+            if trend_arr[i] == cur_trend:
+                matches += 1
+        ok = matches / lookback >= 0.6  # 60% trend consistency
+    result[0] = 1 if ok else 0
+    passed += result[0]
+    if (passed + 3) / 4 < pass_threshold:
+        return result
+
+    # 2. Volatility: current ATR vs mean of the previous 10 (NaNs skipped)
+    ok = False
+    if current_idx >= 10:
+        atr_sum = 0.0
+        atr_count = 0
+        for i in range(current_idx - 10, current_idx):
+            if atr_arr[i] == atr_arr[i]:
+                atr_sum += atr_arr[i]
+                atr_count += 1
+        if atr_count > 0:
+            ok = atr_arr[current_idx] <= (atr_sum / atr_count) * 2.0
+    result[2] = 1 if ok else 0
+    passed += result[2]
+    if (passed + 2) / 4 < pass_threshold:
+        return result
+
+    # 3. Price momentum over the lookback window
+    ok = False
+    if current_idx >= lookback:
+        start_close = close_arr[current_idx - lookback]
+        price_direction = (close_arr[current_idx] - start_close) / start_close
+        if signal_code == 1:
+            ok = price_direction > -0.0005  # Not falling too fast
+        elif signal_code == -1:
+            ok = price_direction < 0.0005   # Not rising too fast
+    result[1] = 1 if ok else 0
+    passed += result[1]
+    if (passed + 1) / 4 < pass_threshold:
+        return result
+
+    # 4. Distance to support (BUY) / resistance (SELL), within 0.2%
+    ok = False
+    if support != 0.0 and resistance != 0.0:
+        if signal_code == 1:
+            ok = abs(price - support) / price <= 0.002
+        elif signal_code == -1:
+            ok = abs(price - resistance) / price <= 0.002
+    result[3] = 1 if ok else 0
+
+    return result
+
+
 def enhanced_signal_filter(df_with_indicators, current_signal, lookback_periods=3):
     """
     Enhanced signal filtering to reduce false positives
@@ -24,56 +110,49 @@ def enhanced_signal_filter(df_with_indicators, current_signal, lookback_periods=
     if not current_signal or current_signal['signal'] in ['HOLD', 'HOLD_LONG', 'HOLD_SHORT']:
         return current_signal
     
-    # Get current index
-    current_idx = len(df_with_indicators) - 1
-    
+    # Raw NumPy views, extracted once; no per-slice Series construction
+    trend_arr = df_with_indicators['trend'].to_numpy(dtype=np.float64)
+    close_arr = df_with_indicators['close'].to_numpy(dtype=np.float64)
+    if 'atr' in df_with_indicators.columns:
+        atr_arr = df_with_indicators['atr'].to_numpy(dtype=np.float64)
+    else:
+        # No ATR available: the volatility check cannot pass
+        atr_arr = np.full(len(close_arr), np.nan)
+
+    signal_code = {'BUY': 1, 'SELL': -1}.get(current_signal['signal'], 0)
+    support_level = current_signal.get('support', 0)
+    resistance_level = current_signal.get('resistance', 0)
+
+    checks = _validate_njit(
+        trend_arr,
+        close_arr,
+        atr_arr,
+        float(current_signal['trend']),
+        signal_code,
+        lookback_periods,
+        float(current_signal['price']),
+        float(support_level) if support_level else 0.0,
+        float(resistance_level) if resistance_level else 0.0,
+        0.6,  # 60% threshold
+    )
+
+    # Remaining checks were skipped because the signal could no longer pass
+    if (checks < 0).any():
+        return {
+            **current_signal,
+            'signal': 'HOLD_FILTERED',
+            'filter_passed': False,
+            'filter_reason': f"Failed validation (short-circuit after {int((checks >= 0).sum())} checks)"
+        }
+
     # Validation checks
     validations = {
-        'trend_strength': False,
-        'price_momentum': False, 
-        'volatility_check': False,
-        'support_resistance': False
+        'trend_strength': bool(checks[0]),
+        'price_momentum': bool(checks[1]),
+        'volatility_check': bool(checks[2]),
+        'support_resistance': bool(checks[3])
     }
     
-    # 1. Trend Strength Validation
-    if current_idx >= lookback_periods:
-        recent_trends = df_with_indicators['trend'].iloc[current_idx-lookback_periods:current_idx]
-        trend_consistency = len(recent_trends[recent_trends == current_signal['trend']]) / len(recent_trends)
-        validations['trend_strength'] = trend_consistency >= 0.6  # 60% trend consistency
-    
-    # 2. Price Momentum Validation
-    if current_idx >= lookback_periods:
-        recent_closes = df_with_indicators['close'].iloc[current_idx-lookback_periods:current_idx+1]
-        price_direction = (recent_closes.iloc[-1] - recent_closes.iloc[0]) / recent_closes.iloc[0]
-        
-        if current_signal['signal'] == 'BUY':
-            validations['price_momentum'] = price_direction > -0.0005  # Not falling too fast
-        elif current_signal['signal'] == 'SELL':
-            validations['price_momentum'] = price_direction < 0.0005   # Not rising too fast
-    
-    # 3. Volatility Check (ATR-based)
-    if current_idx >= 10:  # Need enough data for ATR
-        current_atr = df_with_indicators['atr'].iloc[current_idx]
-        avg_atr = df_with_indicators['atr'].iloc[current_idx-10:current_idx].mean()
-        
-        # Reject signals during extremely high volatility
-        validations['volatility_check'] = current_atr <= avg_atr * 2.0
-    
-    # 4. Support/Resistance Validation
-    current_price = current_signal['price']
-    support_level = current_signal.get('support', 0)
-    resistance_level = current_signal.get('resistance', 0)
-    
-    if support_level and resistance_level:
-        if current_signal['signal'] == 'BUY':
-            # Buy signal should be near support
-            distance_to_support = abs(current_price - support_level) / current_price
-            validations['support_resistance'] = distance_to_support <= 0.002  # Within 0.2%
-        elif current_signal['signal'] == 'SELL':
-            # Sell signal should be near resistance
-            distance_to_resistance = abs(current_price - resistance_level) / current_price
-            validations['support_resistance'] = distance_to_resistance <= 0.002  # Within 0.2%
-    
     # Calculate validation score
     validation_score = sum(validations.values()) / len(validations)
     
@@ -97,8 +176,24 @@ def volume_based_filter(df_with_indicators, current_signal, min_volume_percentil
     if not current_signal or 'volume' not in df_with_indicators.columns:
         return current_signal
         
-    current_volume = df_with_indicators['volume'].iloc[-1]
-    volume_percentile = df_with_indicators['volume'].rolling(50).quantile(min_volume_percentile/100).iloc[-1]
+    # Only the last 50-bar window matters, so take its quantile directly
+    # instead of rolling over the whole series
+    volume_raw = df_with_indicators['volume'].to_numpy()
+    volume = volume_raw.astype(np.float64, copy=False)
+    if len(volume) < 50:
+        return current_signal
+    window = volume[-50:]
+    if np.isnan(window).any():
+        return current_signal
+
+    current_volume = volume_raw[-1]
+
+    # Linear interpolation between the two order statistics (same as rolling quantile)
+    pos = (min_volume_percentile / 100) * 49
+    lo = int(pos)
+    hi = min(lo + 1, 49)
+    part = np.partition(window, (lo, hi))
+    volume_percentile = part[lo] + (part[hi] - part[lo]) * (pos - lo)
     
     # Require minimum volume for signal validity
     if current_volume < volume_percentile:
@@ -7,7 +7,7 @@ Time range: Jan 4, 4:00 PM UTC-8 to Jan 9, 4:00 PM UTC-8
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 import sys
 import os
@@ -16,6 +16,13 @@ import os
 sys.path.append('src')
 from indicators import calculate_pp_supertrend, get_current_signal
 
+# pyarrow is optional; it gives pandas a multithreaded CSV reader
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
 # Configuration  
 START_TIME = "2026-01-04 16:00:00-08:00"  # Jan 4, 4:00 PM UTC-8 (2026!)
 END_TIME = "2026-01-09 16:00:00-08:00"    # Jan 9, 4:00 PM UTC-8 (2026!)
@@ -30,7 +37,7 @@ def load_oanda_data(filepath):
         print(f"❌ File not found: {filepath}")
         return None
     
-    df = pd.read_csv(filepath)
+    df = pd.read_csv(filepath, engine=CSV_ENGINE)
     print(f"📊 Loaded {len(df)} rows")
     
     # Convert time column to datetime with UTC timezone
@@ -54,110 +61,94 @@ def filter_time_range(df, start_time, end_time):
     
     print(f"⏰ Filtering data from {start_utc} to {end_utc}")
     
-    filtered_df = df[(df.index >= start_utc) & (df.index <= end_utc)]
+    # Candles are time-ordered, so two binary searches give the range as a slice
+    if df.index.is_monotonic_increasing:
+        start_pos = df.index.searchsorted(start_utc, side='left')
+        end_pos = df.index.searchsorted(end_utc, side='right')
+        filtered_df = df.iloc[start_pos:end_pos]
+    else:
+        filtered_df = df[(df.index >= start_utc) & (df.index <= end_utc)]
     print(f"📈 Filtered to {len(filtered_df)} rows")
     
     return filtered_df
 
-def detect_signals_immediate(df):
-    """Detect signals without any delay"""
+def calculate_indicators(df):
+    """Calculate PP SuperTrend indicators once for both signal detectors"""
     print("🔍 Calculating PP SuperTrend indicators...")
     
-    # Calculate indicators
-    df_with_indicators = calculate_pp_supertrend(
+    return calculate_pp_supertrend(
         df,
         pivot_period=2,
         atr_factor=3.0,
         atr_period=10
     )
-    
+
+def detect_signals_immediate(df_with_indicators):
+    """Detect signals without any delay"""
     signals = []
     
-    # Find all buy/sell signals
-    for i in range(len(df_with_indicators)):
-        if df_with_indicators['buy_signal'].iloc[i]:
-            signals.append({
-                'time': df_with_indicators.index[i],
-                'signal': 'BUY',
-                'price': df_with_indicators['close'].iloc[i],
-                'supertrend': df_with_indicators['supertrend'].iloc[i],
-                'trend': df_with_indicators['trend'].iloc[i],
-                'type': 'immediate'
-            })
-        elif df_with_indicators['sell_signal'].iloc[i]:
-            signals.append({
-                'time': df_with_indicators.index[i],
-                'signal': 'SELL', 
-                'price': df_with_indicators['close'].iloc[i],
-                'supertrend': df_with_indicators['supertrend'].iloc[i],
-                'trend': df_with_indicators['trend'].iloc[i],
-                'type': 'immediate'
-            })
-    
-    return signals, df_with_indicators
+    index = df_with_indicators.index
+    close = df_with_indicators['close'].to_numpy()
+    supertrend = df_with_indicators['supertrend'].to_numpy()
+    trend = df_with_indicators['trend'].to_numpy()
+    
+    # +1 for BUY, -1 for SELL, 0 otherwise; one scan keeps bar order
+    signal_code = df_with_indicators['signal'].to_numpy()
+    hits = np.flatnonzero(signal_code)
+    
+    # Box timestamps for the signal bars only, in one take
+    for i, time in zip(hits, index[hits]):
+        signals.append({
+            'time': time,
+            'signal': 'BUY' if signal_code[i] > 0 else 'SELL',
+            'price': close[i],
+            'supertrend': supertrend[i],
+            'trend': trend[i],
+            'type': 'immediate'
+        })
+    
+    return signals
 
-def detect_signals_with_delay(df, delay_seconds=30):
+def detect_signals_with_delay(df_with_indicators, delay_seconds=30):
     """Detect signals with confirmation delay"""
     print(f"⏳ Detecting signals with {delay_seconds}s confirmation delay...")
     
-    # Calculate indicators
-    df_with_indicators = calculate_pp_supertrend(
-        df,
-        pivot_period=2,
-        atr_factor=3.0,
-        atr_period=10
-    )
-    
     signals = []
     
-    # Find signals and check if they persist after delay
-    for i in range(len(df_with_indicators) - 1):
-        current_time = df_with_indicators.index[i]
-        delay_time = current_time + timedelta(seconds=delay_seconds)
-        
-        # Check for initial signal
-        initial_signal = None
-        if df_with_indicators['buy_signal'].iloc[i]:
-            initial_signal = 'BUY'
-        elif df_with_indicators['sell_signal'].iloc[i]:
-            initial_signal = 'SELL'
-        
-        if initial_signal:
-            # Find the closest data point after delay
-            delayed_df = df_with_indicators[df_with_indicators.index >= delay_time]
-            
-            if len(delayed_df) > 0:
-                delayed_idx = delayed_df.index[0]
-                delayed_row_idx = df_with_indicators.index.get_loc(delayed_idx)
-                
-                # Check if trend is still the same after delay
-                initial_trend = df_with_indicators['trend'].iloc[i]
-                delayed_trend = df_with_indicators['trend'].iloc[delayed_row_idx]
-                
-                if initial_trend == delayed_trend:
-                    # Signal confirmed after delay
-                    signals.append({
-                        'time': current_time,
-                        'confirmed_time': delayed_idx,
-                        'signal': initial_signal,
-                        'price': df_with_indicators['close'].iloc[i],
-                        'confirmed_price': df_with_indicators['close'].iloc[delayed_row_idx],
-                        'supertrend': df_with_indicators['supertrend'].iloc[i],
-                        'trend': initial_trend,
-                        'type': 'delayed_confirmed'
-                    })
-                else:
-                    # Signal was false - trend changed during delay
-                    signals.append({
-                        'time': current_time,
-                        'confirmed_time': delayed_idx,
-                        'signal': initial_signal,
-                        'price': df_with_indicators['close'].iloc[i],
-                        'confirmed_price': df_with_indicators['close'].iloc[delayed_row_idx],
-                        'supertrend': df_with_indicators['supertrend'].iloc[i],
-                        'trend': initial_trend,
-                        'type': 'delayed_rejected'
-                    })
+    index = df_with_indicators.index
+    n = len(index)
+    if n == 0:
+        return signals
+    
+    # Position of the first bar at or after each bar's delay time, for all bars at once
+    delayed_pos = index.searchsorted(index + pd.Timedelta(seconds=delay_seconds), side='left')
+    
+    signal_code = df_with_indicators['signal'].to_numpy()
+    trend = df_with_indicators['trend'].to_numpy()
+    close = df_with_indicators['close'].to_numpy()
+    supertrend = df_with_indicators['supertrend'].to_numpy()
+    
+    # Signal bars (excluding the last bar) that have a bar after the delay
+    signal_mask = (signal_code != 0) & (delayed_pos < n)
+    signal_mask[-1] = False
+    
+    hits = np.flatnonzero(signal_mask)
+    confirm = delayed_pos[hits]
+    
+    # Box timestamps for the signal and confirmation bars only, in one take each
+    for i, j, time, confirmed_time in zip(hits, confirm, index[hits], index[confirm]):
+        # Signal is confirmed if the trend is still the same after the delay,
+        # otherwise it was false - trend changed during delay
+        signals.append({
+            'time': time,
+            'confirmed_time': confirmed_time,
+            'signal': 'BUY' if signal_code[i] > 0 else 'SELL',
+            'price': close[i],
+            'confirmed_price': close[j],
+            'supertrend': supertrend[i],
+            'trend': trend[i],
+            'type': 'delayed_confirmed' if trend[i] == trend[j] else 'delayed_rejected'
+        })
     
     return signals
 
@@ -226,11 +217,14 @@ def main():
     print(f"📅 Analysis period: {START_TIME} to {END_TIME}")
     print(f"📊 Total candles: {len(filtered_df)}")
     
+    # Calculate indicators once, shared by both detectors
+    df_with_indicators = calculate_indicators(filtered_df)
+    
     # Detect immediate signals
-    immediate_signals, df_with_indicators = detect_signals_immediate(filtered_df)
+    immediate_signals = detect_signals_immediate(df_with_indicators)
     
     # Detect signals with delay
-    delayed_signals = detect_signals_with_delay(filtered_df, CONFIRMATION_DELAY_SECONDS)
+    delayed_signals = detect_signals_with_delay(df_with_indicators, CONFIRMATION_DELAY_SECONDS)
     
     # Print results
     print_signals(immediate_signals, "IMMEDIATE SIGNALS (No Delay)")
@@ -2,6 +2,49 @@
 OANDA API Configuration
 """
 
+import sys
+from collections import namedtuple
+from types import MappingProxyType
+
+# Request context of the active account, rebuilt only when the account changes.
+# The headers dict is shared by every caller, so treat it as read-only.
+AccountCtx = namedtuple('AccountCtx', 'base_url headers account_id')
+
+
+def _build_account_ctx(api_key, account_id, base_url):
+    """Build the request context for one account"""
+    return AccountCtx(
+        base_url=base_url,
+        headers={
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        },
+        account_id=account_id
+    )
+
+
+def _freeze_accounts(accounts):
+    """Read-only view of ACCOUNTS with shared API key strings interned"""
+    return MappingProxyType({
+        name: MappingProxyType({**cfg, 'api_key': sys.intern(cfg['api_key'])})
+        for name, cfg in accounts.items()
+    })
+
+
+def _precompute_accounts(accounts, base_url_practice, base_url_live):
+    """Freeze each account's settings together with its prebuilt request context"""
+    precomputed = {}
+    for name, cfg in accounts.items():
+        base_url = base_url_practice if cfg['is_practice'] else base_url_live
+        precomputed[name] = MappingProxyType({
+            'api_key': cfg['api_key'],
+            'account_id': cfg['account_id'],
+            'is_practice': cfg['is_practice'],
+            'ctx': _build_account_ctx(cfg['api_key'], cfg['account_id'], base_url),
+        })
+    return precomputed
+
+
 class OANDAConfig:
     """OANDA API configuration with multi-account support"""
 
@@ -195,6 +238,18 @@ class OANDAConfig:
     base_url_practice = "https://api-fxpractice.oanda.com"
     base_url_live = "https://api-fxtrade.oanda.com"
 
+    # ACCOUNTS is frozen here rather than at its definition so the literal
+    # above keeps the layout list_and_add_accounts.py edits
+    ACCOUNTS = _freeze_accounts(ACCOUNTS)
+
+    # Account names for the unknown-account error message
+    _account_list_str = ', '.join(ACCOUNTS.keys())
+
+    # Per-account settings and request context, built once at class load
+    _PRECOMPUTED = _precompute_accounts(ACCOUNTS, base_url_practice, base_url_live)
+    _active = _PRECOMPUTED[_active_account]
+    _ctx = _active['ctx']
+
     @classmethod
     def set_account(cls, account_name):
         """
@@ -206,14 +261,21 @@ class OANDAConfig:
         Raises:
             ValueError: If account_name doesn't exist in ACCOUNTS
         """
-        if account_name not in cls.ACCOUNTS:
-            available = ', '.join(cls.ACCOUNTS.keys())
-            raise ValueError(f"Account '{account_name}' not found. Available accounts: {available}")
+        active = cls._PRECOMPUTED.get(account_name)
+        if active is None:
+            raise ValueError(f"Account '{account_name}' not found. Available accounts: {cls._account_list_str}")
 
         cls._active_account = account_name
-        cls.api_key = cls.ACCOUNTS[account_name]['api_key']
-        cls.account_id = cls.ACCOUNTS[account_name]['account_id']
-        cls.is_practice = cls.ACCOUNTS[account_name]['is_practice']
+        cls._active = active
+        cls._ctx = active['ctx']
+        cls.api_key = active['api_key']
+        cls.account_id = active['account_id']
+        cls.is_practice = active['is_practice']
+
+    @classmethod
+    def get_ctx(cls):
+        """Get the active account's request context (base_url, headers, account_id)"""
+        return cls._ctx
 
     @classmethod
     def get_active_account(cls):
@@ -228,15 +290,12 @@ class OANDAConfig:
     @classmethod
     def get_base_url(cls):
         """Get the appropriate base URL based on practice/live mode"""
-        return cls.base_url_practice if cls.is_practice else cls.base_url_live
+        return cls._ctx.base_url
 
     @classmethod
     def get_headers(cls):
-        """Get API headers for requests"""
-        return {
-            'Authorization': f'Bearer {cls.api_key}',
-            'Content-Type': 'application/json'
-        }
+        """Get API headers for requests (shared dict, do not mutate)"""
+        return cls._ctx.headers
 
     # API request settings
     api_timeout = 5  # seconds - default timeout for API calls
@@ -244,6 +303,10 @@ class OANDAConfig:
     api_retry_delay = 1  # seconds - delay between retries
 
 
+# Module-level read-only account table
+ACCOUNTS = OANDAConfig.ACCOUNTS
+
+
 class TradingConfig:
     """Trading bot configuration"""
     # Instrument to trade
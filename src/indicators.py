@@ -3,9 +3,55 @@ Pivot Point SuperTrend Indicator Implementation
 Translated from Pine Script to Python
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
+# Numba is optional: without it the kernels below run as plain Python.
+# The kernels are not cache=True: Numba's on-disk cache records the module
+# name, and this module is imported both as 'indicators' (scripts that add
+# src/ to sys.path) and as 'src.indicators', so a cache written under one
+# name breaks the other. They compile once per process instead.
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(nogil=True)
+def _rma_core(values, alpha):
+    """
+    Wilder's RMA of a NaN-free series in one pass
+
+    Mirrors the arithmetic of pandas' ewm(alpha=alpha, adjust=False).mean(),
+    including its alpha -> center-of-mass -> alpha round trip, so results are
+    bit-identical.
+    """
+    com = (1.0 - alpha) / alpha
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+    out = np.empty_like(values)
+    if values.shape[0] == 0:
+        return out
+    weighted = values[0]
+    out[0] = weighted
+    for i in range(1, values.shape[0]):
+        cur = values[i]
+        if weighted != cur:
+            weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        out[i] = weighted
+    return out
+
 
 def calculate_atr(df, period=14):
     """
@@ -21,24 +67,72 @@ def calculate_atr(df, period=14):
     Returns:
         Series with ATR values
     """
-    high = df['high']
-    low = df['low']
-    close = df['close']
-
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+
+    # True range; fmax skips NaNs like DataFrame.max(axis=1). The two gap
+    # terms are computed into one scratch buffer each and folded in place.
+    tr = np.subtract(high, low)
+    gap_high = np.subtract(high, prev_close)
+    np.abs(gap_high, out=gap_high)
+    gap_low = np.subtract(low, prev_close, out=prev_close)
+    np.abs(gap_low, out=gap_low)
+    np.fmax(gap_high, gap_low, out=gap_high)
+    np.fmax(tr, gap_high, out=tr)
 
     # Use RMA (Wilder's Smoothed Moving Average) to match TradingView
     # RMA = (prev_RMA * (period - 1) + current_value) / period
     # This is equivalent to EMA with alpha = 1/period
-    atr = tr.ewm(alpha=1/period, adjust=False).mean()
+    if np.isnan(tr).any():
+        # Gaps in the data: let pandas apply its NaN weighting rules
+        atr = pd.Series(tr, index=df.index).ewm(alpha=1/period, adjust=False).mean()
+    else:
+        atr = pd.Series(_rma_core(tr, 1/period), index=df.index)
 
     return atr
 
 
+def _confirmed_pivots(values, period, beaten_by):
+    """
+    Vectorized pivot detection shared by detect_pivot_highs/detect_pivot_lows
+
+    A bar is a pivot when no neighbour within 'period' bars on either side
+    beats it (beaten_by(neighbour, bar) is False for all of them, so NaN
+    neighbours never disqualify a bar). The pivot value is placed at the
+    confirmation bar, 'period' bars later.
+
+    Args:
+        values: 1-D array of highs or lows
+        period: Number of bars on each side
+        beaten_by: np.greater_equal for highs, np.less_equal for lows
+
+    Returns:
+        ndarray with pivot values at confirmation bars (NaN elsewhere)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < 2 * period + 1:
+        return out
+
+    # Compare the candidate bars against each neighbour offset as whole
+    # contiguous slices (vectorized compares, no per-window reductions)
+    center = values[period:n - period]
+    is_pivot = np.ones(len(center), dtype=bool)
+    for k in range(1, period + 1):
+        is_pivot &= ~beaten_by(values[period - k:n - period - k], center)
+        is_pivot &= ~beaten_by(values[period + k:n - period + k], center)
+
+    # Candidate bars are period..n-period-1; confirmation bars are period later
+    out[2 * period:][is_pivot] = center[is_pivot]
+    return out
+
+
 def detect_pivot_highs(df, period=2):
     """
     Detect pivot highs
@@ -59,27 +153,7 @@ def detect_pivot_highs(df, period=2):
         Series with pivot high values (NaN where no pivot)
     """
     highs = df['high'].values
-    pivot_highs = pd.Series(index=df.index, dtype=float)
-
-    for i in range(period, len(highs) - period):
-        is_pivot = True
-
-        # Check left side
-        for j in range(1, period + 1):
-            if highs[i] <= highs[i - j]:
-                is_pivot = False
-                break
-
-        # Check right side
-        if is_pivot:
-            for j in range(1, period + 1):
-                if highs[i] <= highs[i + j]:
-                    is_pivot = False
-                    break
-
-        if is_pivot:
-            # Place pivot at confirmation bar (period bars later) to match Pine Script
-            pivot_highs.iloc[i + period] = highs[i]
+    pivot_highs = pd.Series(_confirmed_pivots(highs, period, np.greater_equal), index=df.index)
 
     return pivot_highs
 
@@ -104,29 +178,47 @@ def detect_pivot_lows(df, period=2):
         Series with pivot low values (NaN where no pivot)
     """
     lows = df['low'].values
-    pivot_lows = pd.Series(index=df.index, dtype=float)
-
-    for i in range(period, len(lows) - period):
-        is_pivot = True
-
-        # Check left side
-        for j in range(1, period + 1):
-            if lows[i] >= lows[i - j]:
-                is_pivot = False
-                break
+    pivot_lows = pd.Series(_confirmed_pivots(lows, period, np.less_equal), index=df.index)
 
-        # Check right side
-        if is_pivot:
-            for j in range(1, period + 1):
-                if lows[i] >= lows[i + j]:
-                    is_pivot = False
-                    break
+    return pivot_lows
 
-        if is_pivot:
-            # Place pivot at confirmation bar (period bars later) to match Pine Script
-            pivot_lows.iloc[i + period] = lows[i]
 
-    return pivot_lows
+@njit(nogil=True)
+def _ffill_core(values):
+    """Forward fill loop for _ffill"""
+    out = np.empty_like(values)
+    last = np.nan
+    for i in range(values.shape[0]):
+        # values[i] == values[i] only fails for NaN
+        if values[i] == values[i]:
+            last = values[i]
+        out[i] = last
+    return out
+
+
+def _ffill(values):
+    """Forward fill NaNs in a float array (leading NaNs stay NaN)"""
+    if HAVE_NUMBA:
+        return _ffill_core(values)
+    # Without Numba, index the last valid position with maximum.accumulate
+    last = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(last, out=last)
+    return values[last]
+
+
+@njit(nogil=True)
+def _pivot_center_core(pivots):
+    """Weighted center recurrence over consecutive pivot values"""
+    centers = np.empty_like(pivots)
+    if pivots.shape[0] == 0:
+        return centers
+    current_center = pivots[0]
+    centers[0] = current_center
+    for k in range(1, pivots.shape[0]):
+        # Weighted calculation: (center * 2 + lastpp) / 3
+        current_center = (current_center * 2 + pivots[k]) / 3
+        centers[k] = current_center
+    return centers
 
 
 def calculate_pivot_center(pivot_highs, pivot_lows):
@@ -143,136 +235,343 @@ def calculate_pivot_center(pivot_highs, pivot_lows):
     Returns:
         Series with center line values
     """
-    center = pd.Series(index=pivot_highs.index, dtype=float)
-    current_center = None
-
-    for i in range(len(pivot_highs)):
-        # Get the last pivot (high or low)
-        lastpp = None
-        if not pd.isna(pivot_highs.iloc[i]):
-            lastpp = pivot_highs.iloc[i]
-        elif not pd.isna(pivot_lows.iloc[i]):
-            lastpp = pivot_lows.iloc[i]
-
-        # Update center if we have a new pivot
-        if lastpp is not None:
-            if current_center is None:
-                current_center = lastpp
-            else:
-                # Weighted calculation: (center * 2 + lastpp) / 3
-                current_center = (current_center * 2 + lastpp) / 3
+    ph = pivot_highs.to_numpy(dtype=np.float64)
+    pl = pivot_lows.to_numpy(dtype=np.float64)
 
-        center.iloc[i] = current_center
+    # Last pivot per bar (a pivot high wins over a pivot low on the same bar)
+    lastpp = np.where(np.isnan(ph), pl, ph)
+    pivot_positions = np.flatnonzero(~np.isnan(lastpp))
+
+    # Run the recurrence over the pivots only, then carry each center
+    # forward to the bars up to the next pivot
+    values = np.full(len(lastpp), np.nan)
+    values[pivot_positions] = _pivot_center_core(lastpp[pivot_positions])
+    last = np.maximum.accumulate(np.where(np.isnan(lastpp), -1, np.arange(len(lastpp))))
+    values = np.where(last >= 0, values[last], np.nan)
+
+    center = pd.Series(values, index=pivot_highs.index)
 
     return center
 
 
-def calculate_pp_supertrend(df, pivot_period=2, atr_factor=3.0, atr_period=10):
+@njit(nogil=True)
+def _supertrend_core(close, lower_band, upper_band):
     """
-    Calculate Pivot Point SuperTrend indicator
+    Trailing stop / trend recurrence of the PP SuperTrend
 
-    Args:
-        df: DataFrame with OHLC data
-        pivot_period: Period for pivot point detection
-        atr_factor: Multiplier for ATR
-        atr_period: Period for ATR calculation
+    Each bar depends on the previous one, so this is a plain loop over
+    arrays (compiled to native code when Numba is installed).
 
     Returns:
-        DataFrame with additional columns:
-        - pivot_high, pivot_low: Detected pivot points
-        - center: Dynamic center line
-        - atr: Average True Range
-        - supertrend: SuperTrend line value
-        - trend: 1 for uptrend, -1 for downtrend
-        - buy_signal: True where buy signal occurs
-        - sell_signal: True where sell signal occurs
+        tuple of arrays: (trailing_up, trailing_down, trend, supertrend)
     """
-    result = df.copy()
-
-    # Calculate ATR
-    result['atr'] = calculate_atr(result, atr_period)
-
-    # Detect pivot points
-    result['pivot_high'] = detect_pivot_highs(result, pivot_period)
-    result['pivot_low'] = detect_pivot_lows(result, pivot_period)
-
-    # Calculate center line
-    result['center'] = calculate_pivot_center(result['pivot_high'], result['pivot_low'])
-
-    # Forward fill center line where no new pivots exist
-    result['center'] = result['center'].ffill()
+    n = close.shape[0]
+    trailing_up = np.full(n, np.nan)
+    trailing_down = np.full(n, np.nan)
+    trend = np.zeros(n, dtype=np.int8)
+    supertrend = np.full(n, np.nan)
+    _supertrend_fill(close, lower_band, upper_band,
+                     trailing_up, trailing_down, trend, supertrend, 1)
+    return trailing_up, trailing_down, trend, supertrend
+
+
+@njit(nogil=True)
+def _supertrend_fill(close, lower_band, upper_band,
+                     trailing_up, trailing_down, trend, supertrend, start):
+    """
+    Run the SuperTrend recurrence in place from bar 'start' onwards
 
-    # Calculate upper and lower bands
-    result['upper_band'] = result['center'] + (atr_factor * result['atr'])
-    result['lower_band'] = result['center'] - (atr_factor * result['atr'])
+    The output arrays must already hold the values of the bars before
+    'start' (NaN / 0 from 'start' on).
+    """
+    n = close.shape[0]
+    if start >= n:
+        return
 
-    # Initialize columns
-    result['trailing_up'] = np.nan
-    result['trailing_down'] = np.nan
-    result['trend'] = 0
-    result['supertrend'] = np.nan
+    # Trend carried into each bar; a bar still at trend 0 counts as an uptrend
+    prev_trend = trend[start-1] if trend[start-1] != 0 else 1
 
     # Calculate trailing stops and trend
-    for i in range(1, len(result)):
-        # Skip if we don't have necessary data yet
-        if pd.isna(result['lower_band'].iloc[i]) or pd.isna(result['upper_band'].iloc[i]):
+    for i in range(start, n):
+        # Skip if we don't have necessary data yet (x != x only holds for NaN)
+        if lower_band[i] != lower_band[i] or upper_band[i] != upper_band[i]:
+            # Skipped bars keep trend 0, so the next bar starts from an uptrend
+            prev_trend = 1
             continue
 
         # Calculate Trailing Up
-        if not pd.isna(result['trailing_up'].iloc[i-1]):
-            if result['close'].iloc[i-1] > result['trailing_up'].iloc[i-1]:
-                result.loc[result.index[i], 'trailing_up'] = max(
-                    result['lower_band'].iloc[i],
-                    result['trailing_up'].iloc[i-1]
-                )
+        if trailing_up[i-1] == trailing_up[i-1]:
+            if close[i-1] > trailing_up[i-1]:
+                trailing_up[i] = max(lower_band[i], trailing_up[i-1])
             else:
-                result.loc[result.index[i], 'trailing_up'] = result['lower_band'].iloc[i]
+                trailing_up[i] = lower_band[i]
         else:
-            result.loc[result.index[i], 'trailing_up'] = result['lower_band'].iloc[i]
+            trailing_up[i] = lower_band[i]
 
         # Calculate Trailing Down
-        if not pd.isna(result['trailing_down'].iloc[i-1]):
-            if result['close'].iloc[i-1] < result['trailing_down'].iloc[i-1]:
-                result.loc[result.index[i], 'trailing_down'] = min(
-                    result['upper_band'].iloc[i],
-                    result['trailing_down'].iloc[i-1]
-                )
+        if trailing_down[i-1] == trailing_down[i-1]:
+            if close[i-1] < trailing_down[i-1]:
+                trailing_down[i] = min(upper_band[i], trailing_down[i-1])
             else:
-                result.loc[result.index[i], 'trailing_down'] = result['upper_band'].iloc[i]
+                trailing_down[i] = upper_band[i]
         else:
-            result.loc[result.index[i], 'trailing_down'] = result['upper_band'].iloc[i]
+            trailing_down[i] = upper_band[i]
 
         # Determine trend
-        prev_trend = result['trend'].iloc[i-1] if result['trend'].iloc[i-1] != 0 else 1
-
-        if result['close'].iloc[i] > result['trailing_down'].iloc[i-1]:
-            result.loc[result.index[i], 'trend'] = 1
-        elif result['close'].iloc[i] < result['trailing_up'].iloc[i-1]:
-            result.loc[result.index[i], 'trend'] = -1
+        if close[i] > trailing_down[i-1]:
+            trend[i] = 1
+        elif close[i] < trailing_up[i-1]:
+            trend[i] = -1
         else:
-            result.loc[result.index[i], 'trend'] = prev_trend
+            trend[i] = prev_trend
+        prev_trend = trend[i]
 
         # Set SuperTrend line
-        if result['trend'].iloc[i] == 1:
-            result.loc[result.index[i], 'supertrend'] = result['trailing_up'].iloc[i]
+        if trend[i] == 1:
+            supertrend[i] = trailing_up[i]
         else:
-            result.loc[result.index[i], 'supertrend'] = result['trailing_down'].iloc[i]
+            supertrend[i] = trailing_down[i]
+
+
+# Recent calculate_pp_supertrend results keyed by input content and parameters.
+# Live bots re-poll candles far more often than candles close (and backtests
+# re-slice the same higher-timeframe window for many steps), so identical
+# inputs are common.
+_SUPERTREND_CACHE = OrderedDict()
+_SUPERTREND_CACHE_SIZE = 8
+# Guards every read and write of the cache so callers on different threads
+# can share it. It is not held while computing: the kernels release the GIL.
+_SUPERTREND_CACHE_LOCK = threading.Lock()
 
-    # Generate buy/sell signals
-    result['buy_signal'] = False
-    result['sell_signal'] = False
+# pandas >= 3 always copies on write, so there a shallow copy of a cached
+# frame is enough to keep callers' edits out of the cache
+_ALWAYS_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
 
-    for i in range(1, len(result)):
-        if result['trend'].iloc[i] == 1 and result['trend'].iloc[i-1] == -1:
-            result.loc[result.index[i], 'buy_signal'] = True
-        elif result['trend'].iloc[i] == -1 and result['trend'].iloc[i-1] == 1:
-            result.loc[result.index[i], 'sell_signal'] = True
 
-    # Calculate support and resistance levels
-    result['support'] = result['pivot_low'].ffill()
-    result['resistance'] = result['pivot_high'].ffill()
+def _supertrend_cache_key(df, pivot_period, atr_factor, atr_period):
+    """
+    Content hash of the input frame plus parameters, or None if the frame
+    can't be hashed (then the result is simply not cached)
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    layout = (tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), str(df.index.dtype))
+    return (digest, layout, pivot_period, atr_factor, atr_period)
+
 
-    return result
+def calculate_pp_supertrend(df, pivot_period=2, atr_factor=3.0, atr_period=10):
+    """
+    Calculate Pivot Point SuperTrend indicator
+
+    Args:
+        df: DataFrame with OHLC data
+        pivot_period: Period for pivot point detection
+        atr_factor: Multiplier for ATR
+        atr_period: Period for ATR calculation
+
+    Returns:
+        DataFrame with additional columns:
+        - pivot_high, pivot_low: Detected pivot points
+        - center: Dynamic center line
+        - atr: Average True Range
+        - supertrend: SuperTrend line value
+        - trend: 1 for uptrend, -1 for downtrend (int8)
+        - signal: 1 where a buy signal occurs, -1 for a sell signal, 0 otherwise (int8)
+        - buy_signal: True where buy signal occurs
+        - sell_signal: True where sell signal occurs
+    """
+    key = _supertrend_cache_key(df, pivot_period, atr_factor, atr_period)
+    if key is None:
+        return _compute_pp_supertrend(df, pivot_period, atr_factor, atr_period)
+
+    with _SUPERTREND_CACHE_LOCK:
+        cached = _SUPERTREND_CACHE.get(key)
+        if cached is None:
+            # A re-polled frame usually matches a cached one up to its last
+            # (still forming or newly closed) bar, so collect those to try
+            # extending first, newest first
+            candidates = [prev for prev_key, prev in reversed(_SUPERTREND_CACHE.items())
+                          if prev_key[1:] == key[1:]]
+        else:
+            _SUPERTREND_CACHE.move_to_end(key)
+
+    if cached is None:
+        for prev in candidates:
+            cached = _extend_pp_supertrend(df, prev, pivot_period, atr_factor, atr_period)
+            if cached is not None:
+                break
+        if cached is None:
+            cached = _compute_pp_supertrend(df, pivot_period, atr_factor, atr_period)
+        with _SUPERTREND_CACHE_LOCK:
+            _SUPERTREND_CACHE[key] = cached
+            if len(_SUPERTREND_CACHE) > _SUPERTREND_CACHE_SIZE:
+                _SUPERTREND_CACHE.popitem(last=False)
+
+    # Hand out a copy so callers can't modify the cached frame
+    return cached.copy(deep=not _ALWAYS_COPY_ON_WRITE)
+
+
+def _extend_pp_supertrend(df, prev, pivot_period, atr_factor, atr_period):
+    """
+    Incremental calculate_pp_supertrend for a frame whose bars before the
+    last one match an earlier result's input
+
+    Every indicator column only looks back, so all rows but the last are
+    taken from 'prev' and only the last bar is computed, with the same
+    arithmetic as the full calculation.
+
+    Returns:
+        DataFrame like _compute_pp_supertrend, or None if 'prev' can't be
+        extended (then the caller does the full calculation)
+    """
+    n = len(df)
+    last = n - 1
+    if n < 2 * pivot_period + 2 or len(prev) < last:
+        return None
+
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    for col, values in (('high', high), ('low', low), ('close', close)):
+        if not np.array_equal(prev[col].to_numpy(dtype=np.float64)[:last], values[:last]):
+            return None
+    # Gaps take pandas' NaN-aware ATR path, which has no one-bar update
+    if not (np.isfinite(high).all() and np.isfinite(low).all() and np.isfinite(close).all()):
+        return None
+
+    def extend(col, value):
+        """Cached column values before the last bar, plus 'value'"""
+        values = prev[col].to_numpy()
+        out = np.empty(n, dtype=values.dtype)
+        out[:last] = values[:last]
+        out[last] = value
+        return out
+
+    # ATR: one step of _rma_core on the last true range
+    tr = max(high[last] - low[last],
+             max(abs(high[last] - close[last - 1]), abs(low[last] - close[last - 1])))
+    alpha = 1 / atr_period
+    com = (1.0 - alpha) / alpha
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+    atr = extend('atr', np.nan)
+    weighted = atr[last - 1]
+    if weighted != tr:
+        weighted = (old_wt * weighted + alpha * tr) / (old_wt + alpha)
+    atr[last] = weighted
+
+    # Pivots confirmed on the last bar need only its trailing window
+    window = slice(last - 2 * pivot_period, n)
+    ph = _confirmed_pivots(high[window], pivot_period, np.greater_equal)[-1]
+    pl = _confirmed_pivots(low[window], pivot_period, np.less_equal)[-1]
+    pivot_high = extend('pivot_high', ph)
+    pivot_low = extend('pivot_low', pl)
+
+    # Center line: the previous bar holds the center of the latest pivot
+    center = extend('center', np.nan)
+    prev_center = center[last - 1]
+    lastpp = ph if ph == ph else pl
+    if lastpp != lastpp:
+        center[last] = prev_center
+    elif prev_center != prev_center:
+        center[last] = lastpp
+    else:
+        center[last] = (prev_center * 2 + lastpp) / 3
+
+    upper_band = extend('upper_band', center[last] + (atr_factor * atr[last]))
+    lower_band = extend('lower_band', center[last] - (atr_factor * atr[last]))
+
+    trailing_up = extend('trailing_up', np.nan)
+    trailing_down = extend('trailing_down', np.nan)
+    trend = extend('trend', 0)
+    supertrend = extend('supertrend', np.nan)
+    _supertrend_fill(close, lower_band, upper_band,
+                     trailing_up, trailing_down, trend, supertrend, last)
+
+    if trend[last] == 1 and trend[last - 1] == -1:
+        signal = extend('signal', 1)
+    elif trend[last] == -1 and trend[last - 1] == 1:
+        signal = extend('signal', -1)
+    else:
+        signal = extend('signal', 0)
+
+    support = extend('support', np.nan)
+    support[last] = pl if pl == pl else support[last - 1]
+    resistance = extend('resistance', np.nan)
+    resistance[last] = ph if ph == ph else resistance[last - 1]
+
+    return df.assign(
+        atr=atr,
+        pivot_high=pivot_high,
+        pivot_low=pivot_low,
+        center=center,
+        upper_band=upper_band,
+        lower_band=lower_band,
+        trailing_up=trailing_up,
+        trailing_down=trailing_down,
+        trend=trend,
+        supertrend=supertrend,
+        signal=signal,
+        buy_signal=signal == 1,
+        sell_signal=signal == -1,
+        support=support,
+        resistance=resistance
+    )
+
+
+def _compute_pp_supertrend(df, pivot_period, atr_factor, atr_period):
+    """Uncached body of calculate_pp_supertrend"""
+    # Calculate ATR
+    atr = calculate_atr(df, atr_period)
+
+    # Detect pivot points
+    pivot_high = detect_pivot_highs(df, pivot_period)
+    pivot_low = detect_pivot_lows(df, pivot_period)
+
+    # Calculate center line, forward filled where no new pivots exist
+    # (calculate_pivot_center already carries each center forward)
+    center = calculate_pivot_center(pivot_high, pivot_low).to_numpy()
+
+    # Calculate upper and lower bands from one shared ATR offset; the lower
+    # band reuses the offset's buffer
+    band_offset = np.multiply(atr.to_numpy(), atr_factor)
+    upper_band = np.add(center, band_offset)
+    lower_band = np.subtract(center, band_offset, out=band_offset)
+
+    # Sequential recurrence, compiled when Numba is available
+    trailing_up, trailing_down, trend, supertrend = _supertrend_core(
+        df['close'].to_numpy(dtype=np.float64), lower_band, upper_band
+    )
+
+    # Generate buy/sell signals where the trend flips, as one int8 column
+    # (1 = buy, -1 = sell, 0 = none); the boolean columns are derived from it
+    signal = np.zeros(len(trend), dtype=np.int8)
+    signal[1:][(trend[1:] == 1) & (trend[:-1] == -1)] = 1
+    signal[1:][(trend[1:] == -1) & (trend[:-1] == 1)] = -1
+
+    # Attach all indicator columns in one step; the OHLC data itself is not
+    # duplicated up front (assign only copies lazily under copy-on-write)
+    return df.assign(
+        atr=atr,
+        pivot_high=pivot_high,
+        pivot_low=pivot_low,
+        center=center,
+        upper_band=upper_band,
+        lower_band=lower_band,
+        trailing_up=trailing_up,
+        trailing_down=trailing_down,
+        trend=trend,
+        supertrend=supertrend,
+        signal=signal,
+        buy_signal=signal == 1,
+        sell_signal=signal == -1,
+        # Support and resistance levels
+        support=_ffill(pivot_low.to_numpy()),
+        resistance=_ffill(pivot_high.to_numpy())
+    )
 
 
 def get_current_signal(df, use_closed_candles_only=False):
@@ -299,80 +598,102 @@ def get_current_signal(df, use_closed_candles_only=False):
             'resistance': current resistance level
         }
     """
-    if len(df) == 0:
+    n = len(df)
+    if n == 0:
         return None
 
-    # Current row always points to the latest candle (for real-time SuperTrend price)
-    current_row = df.iloc[-1]
+    # Current bar always points to the latest candle (for real-time SuperTrend price)
+    cur = n - 1
 
     # When use_closed_candles_only=True:
     # - Use closed candle for SIGNAL detection (to avoid repainting)
     # - Use current candle for SUPERTREND price (for real-time SL)
     if use_closed_candles_only:
-        if len(df) < 2:
+        if n < 2:
             return None
-        signal_row = df.iloc[-2]  # Last CLOSED candle for signal
-        prev_row = df.iloc[-3] if len(df) > 2 else None
+        sig = n - 2  # Last CLOSED candle for signal
+        prev = n - 3 if n > 2 else None
     else:
-        signal_row = df.iloc[-1]  # Last candle for signal
-        prev_row = df.iloc[-2] if len(df) > 1 else None
+        sig = n - 1  # Last candle for signal
+        prev = n - 2 if n > 1 else None
+
+    # Read single cells straight from the column arrays instead of building row Series
+    arrays = {}
+
+    def cell(col, pos):
+        arr = arrays.get(col)
+        if arr is None:
+            arr = arrays[col] = df[col].to_numpy()
+        return arr[pos]
 
-    # Check for buy signal (from signal_row - confirmed candle)
-    if signal_row['buy_signal']:
+    def opt_float(col, pos):
+        value = cell(col, pos)
+        # value != value only holds for NaN
+        return None if value is None or value != value else float(value)
+
+    signal_trend = cell('trend', sig)
+    signal_code = cell('signal', sig)
+
+    # Check for buy signal (from signal bar - confirmed candle)
+    if signal_code == 1:
         signal = 'BUY'
     # Check for sell signal
-    elif signal_row['sell_signal']:
+    elif signal_code == -1:
         signal = 'SELL'
     # If in uptrend but no new signal, trend continuation
-    elif signal_row['trend'] == 1:
+    elif signal_trend == 1:
         signal = 'HOLD_LONG'
     # If in downtrend but no new signal, trend continuation
-    elif signal_row['trend'] == -1:
+    elif signal_trend == -1:
         signal = 'HOLD_SHORT'
     # Should never reach here if PP SuperTrend is working correctly
     else:
         # Default to trend-based signal if somehow trend is 0
-        signal = 'HOLD_LONG' if signal_row['close'] > signal_row['supertrend'] else 'HOLD_SHORT'
+        signal = 'HOLD_LONG' if cell('close', sig) > cell('supertrend', sig) else 'HOLD_SHORT'
+
+    has_high = 'high' in df.columns
+    has_low = 'low' in df.columns
 
     signal_info = {
         'signal': signal,
-        'trend': int(signal_row['trend']),
-        # SuperTrend price from CURRENT row (real-time) for accurate SL placement
-        'supertrend': float(current_row['supertrend']) if not pd.isna(current_row['supertrend']) else None,
-        # Price from current row (real-time)
-        'price': float(current_row['close']),
+        'trend': int(signal_trend),
+        # SuperTrend price from CURRENT bar (real-time) for accurate SL placement
+        'supertrend': opt_float('supertrend', cur),
+        # Price from current bar (real-time)
+        'price': float(cell('close', cur)),
         # High and low wick prices from current candle for tracking
-        'high': float(current_row['high']) if 'high' in current_row and not pd.isna(current_row['high']) else None,
-        'low': float(current_row['low']) if 'low' in current_row and not pd.isna(current_row['low']) else None,
+        'high': opt_float('high', cur) if has_high else None,
+        'low': opt_float('low', cur) if has_low else None,
         # Closed candle close price (confirmed/completed candle) for emergency close detection
-        'closed_candle_close': float(signal_row['close']),
-        'support': float(current_row['support']) if not pd.isna(current_row['support']) else None,
-        'resistance': float(current_row['resistance']) if not pd.isna(current_row['resistance']) else None,
-        'atr': float(current_row['atr']) if not pd.isna(current_row['atr']) else None,
-        'pivot': float(current_row['center']) if not pd.isna(current_row['center']) else None,
-        # Trailing stops for emergency close checks - use CLOSED candle (signal_row) values
-        # CRITICAL: Must use signal_row, not current_row, because:
-        # - When price crosses above trailing_down, current_row's trailing_down RESETS to upper_band
+        'closed_candle_close': float(cell('close', sig)),
+        'support': opt_float('support', cur),
+        'resistance': opt_float('resistance', cur),
+        'atr': opt_float('atr', cur),
+        'pivot': opt_float('center', cur),
+        # Trailing stops for emergency close checks - use CLOSED candle (signal bar) values
+        # CRITICAL: Must use the signal bar, not the current bar, because:
+        # - When price crosses above trailing_down, the current bar's trailing_down RESETS to upper_band
         # - This would cause emergency close to fail (comparing against wrong/reset value)
-        # - signal_row has the trailing stop value BEFORE any reset from current bar
+        # - The signal bar has the trailing stop value BEFORE any reset from current bar
         # trailing_up = support level (for LONG positions)
         # trailing_down = resistance level (for SHORT positions)
-        'trailing_up': float(signal_row['trailing_up']) if not pd.isna(signal_row['trailing_up']) else None,
-        'trailing_down': float(signal_row['trailing_down']) if not pd.isna(signal_row['trailing_down']) else None
+        'trailing_up': opt_float('trailing_up', sig),
+        'trailing_down': opt_float('trailing_down', sig)
     }
 
     # Add debug info for signal detection
-    if prev_row is not None:
+    if prev is not None:
+        prev_trend = int(cell('trend', prev))
         signal_info['debug'] = {
-            'prev_trend': int(prev_row['trend']),
-            'curr_trend': int(signal_row['trend']),
-            'trend_changed': int(prev_row['trend']) != int(signal_row['trend']),
-            'prev_close': float(prev_row['close']),
-            'curr_close': float(signal_row['close']),
-            'prev_st': float(prev_row['supertrend']) if not pd.isna(prev_row['supertrend']) else None,
-            'curr_st': float(signal_row['supertrend']) if not pd.isna(signal_row['supertrend']) else None,
+            'prev_trend': prev_trend,
+            'curr_trend': int(signal_trend),
+            'trend_changed': prev_trend != int(signal_trend),
+            'prev_close': float(cell('close', prev)),
+            'curr_close': float(cell('close', sig)),
+            'prev_st': opt_float('supertrend', prev),
+            'curr_st': opt_float('supertrend', sig),
             # Add current (real-time) supertrend for reference
-            'realtime_st': float(current_row['supertrend']) if not pd.isna(current_row['supertrend']) else None
+            'realtime_st': opt_float('supertrend', cur)
         }
 
     return signal_info
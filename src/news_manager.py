@@ -6,17 +6,36 @@ Fetches events from OANDA ForexLabs Calendar API and supports
 manual event imports via JSON file for backup/override.
 """
 
+import bisect
 import logging
 import json
 import os
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 import pytz
 
+# orjson is optional; fall back to the stdlib json module when missing
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+
+@lru_cache(maxsize=16)
+def _get_timezone(name: str):
+    """pytz timezone by name, looked up once per name."""
+    return pytz.timezone(name)
+
 
 class NewsEvent:
     """Represents a single economic news event."""
 
+    __slots__ = ('title', 'timestamp', 'currency', 'impact', 'region', 'source',
+                 '_title_lower', '_datetime')
+
     def __init__(self, title: str, timestamp: int, currency: str,
                  impact: int, region: str = None, source: str = 'oanda'):
         """
@@ -36,11 +55,15 @@ class NewsEvent:
         self.impact = impact
         self.region = region
         self.source = source
+        self._title_lower = None
+        self._datetime = None
 
     @property
     def datetime(self) -> datetime:
-        """Get event time as datetime (UTC)."""
-        return datetime.utcfromtimestamp(self.timestamp).replace(tzinfo=pytz.UTC)
+        """Get event time as datetime (UTC), built on first access."""
+        if self._datetime is None:
+            self._datetime = datetime.fromtimestamp(self.timestamp, tz=pytz.UTC)
+        return self._datetime
 
     def matches_keywords(self, keywords: List[str]) -> bool:
         """
@@ -54,9 +77,28 @@ class NewsEvent:
         """
         if not keywords:
             return True  # No keywords = match all
-        title_lower = self.title.lower()
+        title_lower = self.title_lower
         return any(kw.lower() in title_lower for kw in keywords)
 
+    def matches_pattern(self, pattern: re.Pattern) -> bool:
+        """
+        Check if event title matches a compiled keyword pattern.
+
+        Args:
+            pattern: Compiled regex of lowercase keywords (see NewsManager)
+
+        Returns:
+            True if the pattern is found in the lowercased title
+        """
+        return pattern.search(self.title_lower) is not None
+
+    @property
+    def title_lower(self) -> str:
+        """Get lowercased event title (computed once)."""
+        if self._title_lower is None:
+            self._title_lower = self.title.lower()
+        return self._title_lower
+
     def __repr__(self):
         return f"NewsEvent('{self.title}', {self.datetime.strftime('%Y-%m-%d %H:%M')} UTC, {self.currency}, impact={self.impact})"
 
@@ -104,7 +146,13 @@ class NewsManager:
         # Filtering settings
         self.impact_levels = self.config.get('impact_levels', [3])
         self.keywords = self.config.get('event_keywords', [])
+        # All keywords as one alternation, so a title is scanned in a single pass
+        keywords_lower = [kw.lower() for kw in self.keywords or []]
+        self._keyword_pattern = re.compile('|'.join(map(re.escape, keywords_lower)))
         self.currencies = self.config.get('currencies', ['EUR', 'USD'])
+        # Hashed copies for the per-event membership tests
+        self._impact_levels_set = frozenset(self.impact_levels or ())
+        self._currencies_set = frozenset(self.currencies or ())
 
         # OANDA calendar settings
         oanda_config = self.config.get('oanda_calendar', {})
@@ -117,11 +165,21 @@ class NewsManager:
 
         # Cache
         self._event_cache: List[NewsEvent] = []
+        self._event_timestamps: List[int] = []  # Sorted, parallel to _event_cache
         self._cache_updated: Optional[datetime] = None
         self._cache_ttl = timedelta(
             seconds=oanda_config.get('cache_ttl', 3600)  # 1 hour default
         )
 
+        # Raw OANDA calendar events, shared by refresh_events and
+        # get_events_during_period so they fetch at most once per cache TTL
+        self._oanda_events: List[NewsEvent] = []
+        self._oanda_fetched: Optional[datetime] = None
+
+        # Parsed manual events, reused while the file is unchanged
+        self._manual_events: List[NewsEvent] = []
+        self._manual_events_sig: Optional[Tuple[int, int, int]] = None
+
         # Manual events file path
         manual_file = self.config.get('manual_events_file')
         if manual_file:
@@ -166,7 +224,7 @@ class NewsManager:
 
         # Fetch from OANDA Calendar API
         if self.oanda_calendar_enabled:
-            oanda_events = self._fetch_oanda_events()
+            oanda_events = self._get_oanda_events(force=force)
             events.extend(oanda_events)
 
         # Load manual events
@@ -180,15 +238,52 @@ class NewsManager:
         # Sort by timestamp
         filtered_events.sort(key=lambda e: e.timestamp)
 
-        # Update cache
+        # Update cache. Its age runs from the OANDA fetch it was built from,
+        # which predates this refresh when get_events_during_period fetched
+        # first, so the cached events are never more than one TTL old
         self._event_cache = filtered_events
-        self._cache_updated = now
+        self._event_timestamps = [e.timestamp for e in filtered_events]
+        if self.oanda_calendar_enabled and self._oanda_fetched:
+            self._cache_updated = self._oanda_fetched
+        else:
+            self._cache_updated = now
 
         self.logger.debug(f"News cache refreshed: {len(filtered_events)} relevant events found")
         return filtered_events
 
-    def _fetch_oanda_events(self) -> List[NewsEvent]:
-        """Fetch events from OANDA Calendar API."""
+    def _get_oanda_events(self, force: bool = False) -> List[NewsEvent]:
+        """
+        Get OANDA calendar events, re-fetching only when the cache TTL has passed.
+        An empty calendar is cached like any other result; a failed fetch is
+        not, so the next call tries again.
+
+        Args:
+            force: Fetch even if the last fetch is still within the TTL
+
+        Returns:
+            List of NewsEvent objects from the last fetch
+        """
+        now = datetime.utcnow().replace(tzinfo=pytz.UTC)
+        if not force and self._oanda_fetched and now - self._oanda_fetched < self._cache_ttl:
+            return self._oanda_events
+
+        events = self._fetch_oanda_events()
+        if events is None:
+            self._oanda_events = []
+            self._oanda_fetched = None
+        else:
+            self._oanda_events = events
+            self._oanda_fetched = now
+        return self._oanda_events
+
+    def _fetch_oanda_events(self) -> Optional[List[NewsEvent]]:
+        """
+        Fetch events from OANDA Calendar API.
+
+        Returns:
+            List of NewsEvent objects (empty if the calendar has none),
+            or None if the request failed
+        """
         try:
             calendar_data = self.client.get_calendar_events(
                 instrument=self.oanda_instrument,
@@ -220,13 +315,20 @@ class NewsManager:
 
         except Exception as e:
             self.logger.error(f"Failed to fetch OANDA calendar: {e}")
-            return []
+            return None
 
     def _load_manual_events(self) -> List[NewsEvent]:
         """Load events from manual JSON file."""
         try:
-            with open(self.manual_events_file, 'r') as f:
-                data = json.load(f)
+            # Skip parsing while the file is unchanged (st_ino catches atomic replaces)
+            st = os.stat(self.manual_events_file)
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            if sig == self._manual_events_sig:
+                return list(self._manual_events)
+
+            with open(self.manual_events_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
 
             events = []
             for item in data.get('events', []):
@@ -244,7 +346,9 @@ class NewsManager:
                     continue
 
             self.logger.debug(f"Loaded {len(events)} manual events from {self.manual_events_file}")
-            return events
+            self._manual_events = events
+            self._manual_events_sig = sig
+            return list(events)
 
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in manual events file: {e}")
@@ -266,28 +370,42 @@ class NewsManager:
         filtered = []
         now = datetime.utcnow().replace(tzinfo=pytz.UTC)
 
+        # Compare raw Unix timestamps instead of building a datetime per event
+        cutoff_ts = (now - self.post_news_buffer).timestamp()
+
         for event in events:
             # Skip events in the past (beyond post-news buffer)
-            event_end = event.datetime + self.post_news_buffer
-            if event_end < now:
+            if event.timestamp < cutoff_ts:
                 continue
 
             # Filter by impact level
-            if event.impact not in self.impact_levels:
+            if event.impact not in self._impact_levels_set:
                 continue
 
             # Filter by currency
-            if self.currencies and event.currency not in self.currencies:
+            if self.currencies and event.currency not in self._currencies_set:
                 continue
 
             # Filter by keywords (if configured) - skip for manual events
-            if self.keywords and event.source != 'manual' and not event.matches_keywords(self.keywords):
+            if self.keywords and event.source != 'manual' and not event.matches_pattern(self._keyword_pattern):
                 continue
 
             filtered.append(event)
 
         return filtered
 
+    def _event_window(self, start: datetime, end: datetime) -> List[NewsEvent]:
+        """
+        Get cached events that may fall between start and end.
+
+        Uses binary search on the sorted timestamps. The bounds get one
+        second of slack for float rounding, so callers still apply their
+        exact time checks to the returned events.
+        """
+        lo = bisect.bisect_left(self._event_timestamps, start.timestamp() - 1)
+        hi = bisect.bisect_right(self._event_timestamps, end.timestamp() + 1)
+        return self._event_cache[lo:hi]
+
     def get_upcoming_event(self, within_minutes: int = 60) -> Optional[NewsEvent]:
         """
         Get the next upcoming event within the specified time window.
@@ -304,9 +422,9 @@ class NewsManager:
         now = datetime.utcnow().replace(tzinfo=pytz.UTC)
         window_end = now + timedelta(minutes=within_minutes)
 
-        events = self.refresh_events()
+        self.refresh_events()
 
-        for event in events:
+        for event in self._event_window(now, window_end):
             if now <= event.datetime <= window_end:
                 return event
 
@@ -326,9 +444,13 @@ class NewsManager:
             return False, None, None
 
         now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-        events = self.refresh_events()
+        self.refresh_events()
 
-        for event in events:
+        # Only events from now - post buffer to now + pre buffer can block
+        candidates = self._event_window(now - max(self.post_news_buffer, timedelta(0)),
+                                        now + max(self.pre_news_buffer, timedelta(0)))
+
+        for event in candidates:
             event_time = event.datetime
 
             # Check pre-news buffer (upcoming event)
@@ -362,9 +484,12 @@ class NewsManager:
             return False, None, None
 
         now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-        events = self.refresh_events()
+        self.refresh_events()
 
-        for event in events:
+        # Only events from now to now + pre buffer can trigger a close
+        candidates = self._event_window(now, now + max(self.pre_news_buffer, timedelta(0)))
+
+        for event in candidates:
             event_time = event.datetime
 
             # Only check pre-news buffer
@@ -457,21 +582,23 @@ class NewsManager:
         if self.manual_events_file and os.path.exists(self.manual_events_file):
             events.extend(self._load_manual_events())
 
-        # Fetch OANDA events if enabled
+        # OANDA events if enabled (shares the refresh_events fetch within the cache TTL)
         if self.oanda_calendar_enabled:
-            events.extend(self._fetch_oanda_events())
+            events.extend(self._get_oanda_events())
 
         # Filter events by impact and currency (but not keywords for logging purposes)
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
         filtered = []
         for event in events:
             # Filter by impact level
-            if event.impact not in self.impact_levels:
+            if event.impact not in self._impact_levels_set:
                 continue
             # Filter by currency
-            if self.currencies and event.currency not in self.currencies:
+            if self.currencies and event.currency not in self._currencies_set:
                 continue
             # Check if event occurred during the period
-            if start_time <= event.datetime <= end_time:
+            if start_ts <= event.timestamp <= end_ts:
                 filtered.append(event)
 
         # Sort by timestamp
@@ -493,7 +620,7 @@ class NewsManager:
         if not events:
             return ''
 
-        tz = pytz.timezone(timezone_str)
+        tz = _get_timezone(timezone_str)
         parts = []
         for event in events:
             event_time_local = event.datetime.astimezone(tz)
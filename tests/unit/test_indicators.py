@@ -9,19 +9,23 @@ import numpy as np
 from datetime import datetime, timedelta
 import sys
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root and src to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'src'))
 
+import src.indicators as indicators
 from src.indicators import (
     calculate_atr,
     detect_pivot_highs,
     detect_pivot_lows,
     calculate_pivot_center,
     calculate_pp_supertrend,
-    get_current_signal
+    get_current_signal,
+    _compute_pp_supertrend
 )
 
 
@@ -244,6 +248,113 @@ class TestPPSuperTrend:
             elif result['trend'].iloc[i] == -1 and not pd.isna(result['trailing_down'].iloc[i]):
                 assert result['supertrend'].iloc[i] == result['trailing_down'].iloc[i]
 
+    def test_last_bar_update_matches_full_calculation(self, sample_uptrend_candles):
+        """Re-polling with only the last candle new or changed should match a full recalculation."""
+        forming = sample_uptrend_candles.copy()
+        forming.iloc[-1, forming.columns.get_loc('close')] += 0.0005
+
+        calculate_pp_supertrend(sample_uptrend_candles.iloc[:-1])
+        for candles in (sample_uptrend_candles, forming):
+            result = calculate_pp_supertrend(candles)
+            expected = _compute_pp_supertrend(candles, 2, 3.0, 10)
+            pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+    def test_concurrent_calls_share_cache_safely(self, sample_uptrend_candles):
+        """Calls from a thread pool should each get the full calculation for their input."""
+        frames = [sample_uptrend_candles.iloc[:n] for n in range(30, len(sample_uptrend_candles) + 1)]
+        expected = [_compute_pp_supertrend(frame, 2, 3.0, 10) for frame in frames]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(calculate_pp_supertrend, frames * 3))
+
+        for i, result in enumerate(results):
+            pd.testing.assert_frame_equal(result, expected[i % len(frames)], check_exact=True)
+
+
+class TestSupertrendCache:
+    """Tests for the calculate_pp_supertrend result cache."""
+
+    @pytest.fixture(autouse=True)
+    def compute_calls(self, monkeypatch):
+        """Start from an empty cache and count full calculations."""
+        monkeypatch.setattr(indicators, '_SUPERTREND_CACHE', indicators.OrderedDict())
+        calls = []
+
+        def counting_compute(*args):
+            calls.append(args)
+            return _compute_pp_supertrend(*args)
+
+        monkeypatch.setattr(indicators, '_compute_pp_supertrend', counting_compute)
+        return calls
+
+    def test_identical_input_is_served_from_cache(self, sample_uptrend_candles, compute_calls):
+        """A second call with the same candles should not recalculate."""
+        first = calculate_pp_supertrend(sample_uptrend_candles)
+        second = calculate_pp_supertrend(sample_uptrend_candles.copy())
+
+        assert len(compute_calls) == 1
+        pd.testing.assert_frame_equal(first, second, check_exact=True)
+
+    def test_changed_parameters_miss_cache(self, sample_uptrend_candles, compute_calls):
+        """Parameters are part of the key."""
+        calculate_pp_supertrend(sample_uptrend_candles, atr_factor=3.0)
+        calculate_pp_supertrend(sample_uptrend_candles, atr_factor=2.0)
+        calculate_pp_supertrend(sample_uptrend_candles, pivot_period=3)
+
+        assert len(compute_calls) == 3
+
+    def test_changed_earlier_bar_misses_cache(self, sample_uptrend_candles, compute_calls):
+        """A change before the last bar can't be extended and needs a full calculation."""
+        calculate_pp_supertrend(sample_uptrend_candles)
+        revised = sample_uptrend_candles.copy()
+        revised.iloc[10, revised.columns.get_loc('close')] += 0.001
+
+        result = calculate_pp_supertrend(revised)
+
+        assert len(compute_calls) == 2
+        pd.testing.assert_frame_equal(result, _compute_pp_supertrend(revised, 2, 3.0, 10), check_exact=True)
+
+    def test_last_bar_change_is_extended_not_recalculated(self, sample_uptrend_candles, compute_calls):
+        """A frame differing only in its last bar is extended from the cached result."""
+        calculate_pp_supertrend(sample_uptrend_candles.iloc[:-1])
+        calculate_pp_supertrend(sample_uptrend_candles)
+
+        assert len(compute_calls) == 1
+
+    def test_returned_frames_are_isolated_from_cache(self, sample_uptrend_candles):
+        """Editing a returned frame must not change later results."""
+        first = calculate_pp_supertrend(sample_uptrend_candles)
+        expected = first.copy(deep=True)
+        first.loc[first.index[-1], 'supertrend'] = -1.0
+        first['trend'] = 0
+
+        second = calculate_pp_supertrend(sample_uptrend_candles)
+
+        pd.testing.assert_frame_equal(second, expected, check_exact=True)
+
+    def test_least_recently_used_entry_is_evicted(self, sample_uptrend_candles, compute_calls):
+        """The cache keeps at most _SUPERTREND_CACHE_SIZE results, dropping the oldest."""
+        factors = [1.0 + i for i in range(indicators._SUPERTREND_CACHE_SIZE + 1)]
+        for factor in factors:
+            calculate_pp_supertrend(sample_uptrend_candles, atr_factor=factor)
+        assert len(indicators._SUPERTREND_CACHE) == indicators._SUPERTREND_CACHE_SIZE
+
+        calculate_pp_supertrend(sample_uptrend_candles, atr_factor=factors[-1])
+        assert len(compute_calls) == len(factors)
+        calculate_pp_supertrend(sample_uptrend_candles, atr_factor=factors[0])
+        assert len(compute_calls) == len(factors) + 1
+
+    def test_unhashable_frame_is_not_cached(self, sample_uptrend_candles, compute_calls):
+        """Frames pandas can't hash are calculated every time."""
+        candles = sample_uptrend_candles.copy()
+        candles['meta'] = [{'bar': i} for i in range(len(candles))]
+
+        calculate_pp_supertrend(candles)
+        calculate_pp_supertrend(candles)
+
+        assert len(compute_calls) == 2
+        assert len(indicators._SUPERTREND_CACHE) == 0
+
 
 class TestGetCurrentSignal:
     """Tests for signal extraction function."""
@@ -314,3 +425,30 @@ class TestGetCurrentSignal:
         assert 'prev_trend' in signal['debug']
         assert 'curr_trend' in signal['debug']
         assert 'trend_changed' in signal['debug']
+
+
+class TestImportNames:
+    """The module is imported as 'indicators' by scripts and as 'src.indicators' by the bots."""
+
+    def test_both_import_names_work_in_either_order(self):
+        """Compiled kernels must not tie the module to the name it was first imported under."""
+        script = (
+            "import sys\n"
+            "import numpy as np\n"
+            "import pandas as pd\n"
+            "{setup}"
+            "close = np.linspace(1.0, 1.1, 60)\n"
+            "df = pd.DataFrame({{'open': close, 'high': close + 0.001,\n"
+            "                    'low': close - 0.001, 'close': close}})\n"
+            "print(len(indicators.calculate_pp_supertrend(df)))\n"
+        )
+        bare = "sys.path.append('src')\nimport indicators\n"
+        package = "from src import indicators\n"
+
+        for setup in (bare, package, bare):
+            proc = subprocess.run(
+                [sys.executable, '-c', script.format(setup=setup)],
+                cwd=project_root, capture_output=True, text=True
+            )
+            assert proc.returncode == 0, proc.stderr
+            assert proc.stdout.strip() == '60'
@@ -0,0 +1,275 @@
+"""
+Unit tests for NewsManager caching and keyword matching.
+Tests the event window lookup, the manual events file cache, the
+shared OANDA calendar fetch and the keyword checks on NewsEvent.
+"""
+
+import pytest
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytz
+
+# Add project root and src to path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from src.news_manager import NewsManager, NewsEvent
+
+
+class StubCalendarClient:
+    """Stands in for OANDAClient.get_calendar_events, counting calls."""
+
+    def __init__(self, events=None, error=None):
+        self.events = events or []
+        self.error = error
+        self.calls = 0
+
+    def get_calendar_events(self, instrument, period):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.events
+
+
+def future_ts(hours=24):
+    """Whole-second Unix timestamp some hours ahead of now."""
+    return int((datetime.utcnow() + timedelta(hours=hours)).replace(tzinfo=pytz.UTC).timestamp())
+
+
+def calendar_event(timestamp, title='US CPI Report'):
+    return {'title': title, 'timestamp': timestamp, 'currency': 'USD', 'impact': 3, 'region': 'americas'}
+
+
+def make_manager(client, manual_file=None, cache_ttl=3600):
+    config = {'news_filter': {
+        'enabled': True,
+        'manual_events_file': manual_file,
+        'oanda_calendar': {'enabled': True, 'cache_ttl': cache_ttl},
+    }}
+    return NewsManager(client, config, 'account1')
+
+
+def write_manual_events(path, titles, timestamp):
+    with open(path, 'w') as f:
+        json.dump({'events': [{'title': t, 'timestamp': timestamp, 'currency': 'USD', 'impact': 3}
+                              for t in titles]}, f)
+
+
+def utc(timestamp):
+    return datetime.fromtimestamp(timestamp, tz=pytz.UTC)
+
+
+class TestKeywordMatching:
+    """Tests for the two keyword checks on NewsEvent."""
+
+    TITLES = ['US CPI Report', 'FOMC Statement', 'fomc minutes', 'German ZEW', 'Éuro Área CPI', '']
+
+    def test_no_keywords_match_everything(self):
+        assert NewsEvent('German ZEW', future_ts(), 'EUR', 3).matches_keywords([])
+
+    @pytest.mark.parametrize("keywords", [['CPI'], ['fomc', 'Rate'], ['ÉURO'], ['a.c']])
+    def test_keyword_list_agrees_with_manager_pattern(self, keywords):
+        """matches_keywords and the filter's compiled pattern give the same answers."""
+        pattern = NewsManager(None, {'news_filter': {'event_keywords': keywords}}, 'account1')._keyword_pattern
+
+        for title in self.TITLES:
+            event = NewsEvent(title, future_ts(), 'USD', 3)
+            assert event.matches_keywords(keywords) == event.matches_pattern(pattern), title
+
+
+class TestEventWindow:
+    """Tests for the bisect lookup over the sorted event cache."""
+
+    @pytest.fixture
+    def base(self):
+        return future_ts()
+
+    @pytest.fixture
+    def manager(self, base):
+        client = StubCalendarClient([calendar_event(base + 120), calendar_event(base),
+                                     calendar_event(base + 60), calendar_event(base + 60, 'FOMC Statement')])
+        manager = make_manager(client)
+        manager.refresh_events()
+        return manager
+
+    def test_inclusive_bounds_return_all_events(self, manager, base):
+        """Events exactly on start and end are included."""
+        events = manager._event_window(utc(base), utc(base + 120))
+        assert [e.timestamp for e in events] == [base, base + 60, base + 60, base + 120]
+
+    def test_events_within_one_second_of_bounds_are_included(self, manager, base):
+        """The bounds get one second of slack; callers apply the exact checks."""
+        events = manager._event_window(utc(base + 1), utc(base + 119))
+        assert [e.timestamp for e in events] == [base, base + 60, base + 60, base + 120]
+
+    def test_events_beyond_slack_are_excluded(self, manager, base):
+        """Events more than one second outside the window are left out."""
+        events = manager._event_window(utc(base + 2), utc(base + 118))
+        assert [e.timestamp for e in events] == [base + 60, base + 60]
+
+    def test_window_between_events_is_empty(self, manager, base):
+        assert manager._event_window(utc(base + 10), utc(base + 50)) == []
+
+    def test_window_outside_cache_is_empty(self, manager, base):
+        assert manager._event_window(utc(base - 3600), utc(base - 60)) == []
+        assert manager._event_window(utc(base + 180), utc(base + 3600)) == []
+
+    def test_empty_cache_returns_empty(self, base):
+        manager = make_manager(StubCalendarClient())
+        manager.refresh_events()
+        assert manager._event_window(utc(base), utc(base + 120)) == []
+
+
+class TestManualEventsCache:
+    """Tests for reusing parsed manual events while the file is unchanged."""
+
+    @pytest.fixture
+    def manual_file(self, tmp_path):
+        path = tmp_path / 'news_events.json'
+        write_manual_events(path, ['Manual CPI'], future_ts())
+        return str(path)
+
+    def test_unchanged_file_reuses_parsed_events(self, manual_file):
+        manager = make_manager(StubCalendarClient(), manual_file)
+        first = manager._load_manual_events()
+        second = manager._load_manual_events()
+
+        assert [e.title for e in second] == ['Manual CPI']
+        assert second[0] is first[0]
+
+    def test_returned_list_is_a_copy(self, manual_file):
+        """Callers extend the returned list; that must not grow the cache."""
+        manager = make_manager(StubCalendarClient(), manual_file)
+        manager._load_manual_events().append('extra')
+
+        assert len(manager._load_manual_events()) == 1
+
+    def test_rewritten_file_is_reloaded(self, manual_file):
+        manager = make_manager(StubCalendarClient(), manual_file)
+        manager._load_manual_events()
+        write_manual_events(manual_file, ['Manual CPI', 'Manual NFP'], future_ts())
+
+        assert [e.title for e in manager._load_manual_events()] == ['Manual CPI', 'Manual NFP']
+
+    def test_atomic_replace_with_same_size_and_mtime_is_reloaded(self, manual_file, tmp_path):
+        """A file swapped in by rename is caught by its inode even if size and mtime match."""
+        manager = make_manager(StubCalendarClient(), manual_file)
+        manager._load_manual_events()
+        st = os.stat(manual_file)
+
+        replacement = tmp_path / 'replacement.json'
+        write_manual_events(replacement, ['Manual GDP'], future_ts())
+        assert os.path.getsize(replacement) == st.st_size
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, manual_file)
+
+        assert [e.title for e in manager._load_manual_events()] == ['Manual GDP']
+
+    def test_invalid_json_is_not_cached(self, manual_file):
+        """A broken file yields no events, and the fixed file is read again."""
+        manager = make_manager(StubCalendarClient(), manual_file)
+        with open(manual_file, 'w') as f:
+            f.write('{not json')
+        assert manager._load_manual_events() == []
+
+        write_manual_events(manual_file, ['Manual PMI'], future_ts())
+        assert [e.title for e in manager._load_manual_events()] == ['Manual PMI']
+
+
+class TestOandaEventsCache:
+    """Tests for the TTL-cached OANDA calendar fetch."""
+
+    def test_fetch_is_reused_within_ttl(self):
+        client = StubCalendarClient([calendar_event(future_ts())])
+        manager = make_manager(client)
+
+        first = manager._get_oanda_events()
+        second = manager._get_oanda_events()
+
+        assert client.calls == 1
+        assert second is first
+
+    def test_fetch_is_repeated_after_ttl(self):
+        client = StubCalendarClient([calendar_event(future_ts())])
+        manager = make_manager(client)
+        manager._get_oanda_events()
+
+        manager._oanda_fetched -= manager._cache_ttl
+        manager._get_oanda_events()
+
+        assert client.calls == 2
+
+    def test_force_fetches_within_ttl(self):
+        client = StubCalendarClient([calendar_event(future_ts())])
+        manager = make_manager(client)
+        manager._get_oanda_events()
+        manager._get_oanda_events(force=True)
+
+        assert client.calls == 2
+
+    def test_empty_fetch_is_cached(self):
+        """A quiet calendar is a valid answer and is reused within the TTL."""
+        client = StubCalendarClient([])
+        manager = make_manager(client)
+
+        assert manager._get_oanda_events() == []
+        client.events = [calendar_event(future_ts())]
+        assert manager._get_oanda_events() == []
+        assert client.calls == 1
+
+        assert len(manager._get_oanda_events(force=True)) == 1
+        assert client.calls == 2
+
+    def test_failed_fetch_is_not_cached(self):
+        client = StubCalendarClient(error=ConnectionError('calendar unavailable'))
+        manager = make_manager(client)
+
+        assert manager._get_oanda_events() == []
+        assert manager._get_oanda_events() == []
+        assert client.calls == 2
+
+        client.error = None
+        client.events = [calendar_event(future_ts())]
+        assert len(manager._get_oanda_events()) == 1
+        assert client.calls == 3
+
+    def test_failed_refetch_drops_previous_events(self):
+        """A failed refetch after the TTL returns nothing, as before, and is retried next call."""
+        client = StubCalendarClient([calendar_event(future_ts())])
+        manager = make_manager(client)
+        manager._get_oanda_events()
+
+        client.error = ConnectionError('calendar unavailable')
+        assert manager._get_oanda_events(force=True) == []
+        assert manager._oanda_fetched is None
+
+    def test_refresh_shares_fetch_with_period_lookup(self):
+        """refresh_events reuses the fetch made by get_events_during_period."""
+        base = future_ts()
+        client = StubCalendarClient([calendar_event(base)])
+        manager = make_manager(client)
+
+        assert len(manager.get_events_during_period(utc(base - 60), utc(base + 60))) == 1
+        assert len(manager.refresh_events()) == 1
+        assert client.calls == 1
+
+    def test_event_cache_is_dated_from_the_oanda_fetch(self):
+        """A refresh built on an earlier fetch expires with that fetch, not a TTL later."""
+        client = StubCalendarClient([calendar_event(future_ts())])
+        manager = make_manager(client)
+        manager._get_oanda_events()
+        manager._oanda_fetched -= timedelta(minutes=59)
+
+        manager.refresh_events()
+        assert manager._cache_updated == manager._oanda_fetched
+        assert client.calls == 1
+
+        # One minute on, the fetch and the event cache built on it both expire
+        manager._oanda_fetched -= timedelta(minutes=1)
+        manager._cache_updated -= timedelta(minutes=1)
+        manager.refresh_events()
+        assert client.calls == 2
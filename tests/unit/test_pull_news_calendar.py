@@ -0,0 +1,310 @@
+"""
+Unit tests for the Forex Factory calendar cache in pull_news_calendar.
+Tests the TTL shortcut, conditional requests (ETag / 304), the gzip cache
+with its plaintext fallback, and the retry error reporting.
+"""
+
+import pytest
+import gzip
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import requests
+from urllib3.exceptions import MaxRetryError, ResponseError
+
+# Add project root and src to path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import pull_news_calendar as pnc
+
+
+CACHED_EVENTS = [{'title': 'Cached CPI', 'timestamp': 2000000000, 'currency': 'USD',
+                  'impact': 3, 'source': 'forexfactory'}]
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """
+    Stands in for pull_news_calendar.SESSION, recording request headers.
+    next_week, if given, answers requests for next week's feed.
+    """
+
+    def __init__(self, response=None, error=None, next_week=None):
+        self.response = response
+        self.error = error
+        self.next_week = next_week
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        if self.next_week is not None and url.endswith('nextweek.xml'):
+            return self.next_week
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def cached_at(age):
+    return (datetime.utcnow() - age).strftime('%Y-%m-%d %H:%M UTC')
+
+
+def feed_xml(title='Core CPI m/m'):
+    """A one-event feed for two days from now."""
+    date = (datetime.utcnow() + timedelta(days=2)).strftime('%m-%d-%Y')
+    return (f"<weeklyevents><event><title>{title}</title><country>USD</country>"
+            f"<date>{date}</date><time>8:30am</time><impact>High</impact></event>"
+            f"</weeklyevents>").encode('utf-8')
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    cache_file = str(tmp_path / 'news_calendar_cache.json')
+    monkeypatch.setattr(pnc, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(pnc, 'CACHE_FILE', cache_file)
+    monkeypatch.setattr(pnc, 'CACHE_FILE_GZ', f"{cache_file}.gz")
+    return tmp_path
+
+
+def write_cache(age, etag='"v1"', days=7, events=CACHED_EVENTS, compress=True, this_week_count=None):
+    data = {'events': events, 'cached_at': cached_at(age), 'count': len(events),
+            'etag': etag, 'last_modified': 'Mon, 05 Jan 2026 00:00:00 GMT', 'days': days}
+    if this_week_count is not None:
+        data['this_week_count'] = this_week_count
+    if compress:
+        with gzip.open(pnc.CACHE_FILE_GZ, 'wb') as f:
+            f.write(json.dumps(data).encode('utf-8'))
+    else:
+        with open(pnc.CACHE_FILE, 'w') as f:
+            json.dump(data, f)
+
+
+def retry_error(status):
+    """RetryError as raised by requests once urllib3 runs out of status retries."""
+    reason = ResponseError(ResponseError.SPECIFIC_ERROR.format(status_code=status))
+    return requests.exceptions.RetryError(MaxRetryError(None, '/ff_calendar_thisweek.xml', reason))
+
+
+def use_session(monkeypatch, session):
+    monkeypatch.setattr(pnc, 'SESSION', session)
+    return session
+
+
+class TestCacheTTL:
+    """Tests for skipping the network while the cache is fresh."""
+
+    def test_fresh_cache_skips_network(self, monkeypatch):
+        write_cache(age=timedelta(minutes=5))
+        session = use_session(monkeypatch, FakeSession())
+
+        assert pnc.fetch_forexfactory_calendar(days=7) == CACHED_EVENTS
+        assert session.requests == []
+
+    def test_expired_cache_goes_to_network(self, monkeypatch):
+        write_cache(age=timedelta(hours=2))
+        session = use_session(monkeypatch, FakeSession(FakeResponse(304)))
+
+        pnc.fetch_forexfactory_calendar(days=7)
+        assert len(session.requests) == 1
+
+    def test_cache_covering_fewer_days_is_not_used(self, monkeypatch):
+        """A fresh cache for a shorter range can't answer a longer request."""
+        write_cache(age=timedelta(minutes=5), days=7)
+        session = use_session(monkeypatch, FakeSession(FakeResponse(200, feed_xml())))
+        monkeypatch.setattr(pnc, 'fetch_forexfactory_nextweek', lambda days: [])
+
+        events = pnc.fetch_forexfactory_calendar(days=14)
+
+        assert [e['title'] for e in events] == ['Core CPI m/m']
+        assert 'If-None-Match' not in session.requests[0][1]
+
+
+class TestConditionalRequests:
+    """Tests for revalidating an expired cache with its ETag / Last-Modified."""
+
+    def test_expired_cache_sends_validators(self, monkeypatch):
+        write_cache(age=timedelta(hours=2), etag='"v1"')
+        session = use_session(monkeypatch, FakeSession(FakeResponse(304)))
+
+        pnc.fetch_forexfactory_calendar(days=7)
+
+        headers = session.requests[0][1]
+        assert headers['If-None-Match'] == '"v1"'
+        assert headers['If-Modified-Since'] == 'Mon, 05 Jan 2026 00:00:00 GMT'
+
+    def test_not_modified_returns_cache_and_restarts_ttl(self, monkeypatch):
+        write_cache(age=timedelta(hours=2), etag='"v1"')
+        use_session(monkeypatch, FakeSession(FakeResponse(304)))
+
+        assert pnc.fetch_forexfactory_calendar(days=7) == CACHED_EVENTS
+
+        cache = pnc.read_cache()
+        assert cache['etag'] == '"v1"'
+        assert pnc.cache_age_seconds(cache) < pnc.CACHE_TTL_SECONDS
+
+    def test_not_modified_still_refreshes_next_week(self, monkeypatch):
+        """A 304 only vouches for this week's feed; next week's events are fetched again."""
+        stale_next_week = {'title': 'Non-Farm Payrolls', 'timestamp': 2000600000, 'currency': 'USD',
+                           'impact': 3, 'source': 'forexfactory'}
+        write_cache(age=timedelta(hours=2), days=14, events=CACHED_EVENTS + [stale_next_week],
+                    this_week_count=1)
+        session = use_session(monkeypatch, FakeSession(
+            FakeResponse(304), next_week=FakeResponse(200, feed_xml('Non-Farm Payrolls (rescheduled)'))
+        ))
+
+        events = pnc.fetch_forexfactory_calendar(days=14)
+
+        assert [e['title'] for e in events] == ['Cached CPI', 'Non-Farm Payrolls (rescheduled)']
+        assert sorted(url.rsplit('_', 1)[1] for url, _ in session.requests) == ['nextweek.xml', 'thisweek.xml']
+        cache = pnc.read_cache()
+        assert cache['events'] == events
+        assert cache['this_week_count'] == 1
+        assert cache['etag'] == '"v1"'
+
+    def test_not_modified_for_one_week_drops_cached_next_week(self, monkeypatch):
+        """A 7-day request answered by a 304 returns only this week's cached events."""
+        write_cache(age=timedelta(hours=2), days=14, events=CACHED_EVENTS + [dict(CACHED_EVENTS[0], title='Later')],
+                    this_week_count=1)
+        session = use_session(monkeypatch, FakeSession(FakeResponse(304)))
+
+        assert pnc.fetch_forexfactory_calendar(days=7) == CACHED_EVENTS
+        assert len(session.requests) == 1
+
+    def test_cache_without_week_split_is_not_revalidated(self, monkeypatch):
+        """A two-week cache that doesn't record which events are this week's is fetched in full."""
+        write_cache(age=timedelta(minutes=5), days=14)
+        session = use_session(monkeypatch, FakeSession(
+            FakeResponse(200, feed_xml()), next_week=FakeResponse(200, feed_xml('ECB Press Conference'))
+        ))
+
+        events = pnc.fetch_forexfactory_calendar(days=14)
+
+        assert [e['title'] for e in events] == ['Core CPI m/m', 'ECB Press Conference']
+        assert all('If-None-Match' not in headers for _, headers in session.requests)
+        assert pnc.read_cache()['this_week_count'] == 1
+
+    def test_changed_feed_replaces_cache_and_etag(self, monkeypatch):
+        write_cache(age=timedelta(hours=2), etag='"v1"')
+        use_session(monkeypatch, FakeSession(FakeResponse(200, feed_xml('ECB Press Conference'),
+                                                          {'ETag': '"v2"'})))
+
+        events = pnc.fetch_forexfactory_calendar(days=7)
+
+        assert [e['title'] for e in events] == ['ECB Press Conference']
+        cache = pnc.read_cache()
+        assert cache['etag'] == '"v2"'
+        assert cache['events'] == events
+
+    def test_error_status_falls_back_to_cache(self, monkeypatch):
+        write_cache(age=timedelta(hours=2))
+        use_session(monkeypatch, FakeSession(FakeResponse(500)))
+
+        assert pnc.fetch_forexfactory_calendar(days=7) == CACHED_EVENTS
+
+    def test_exhausted_retries_fall_back_to_cache(self, monkeypatch, capsys):
+        write_cache(age=timedelta(hours=2))
+        use_session(monkeypatch, FakeSession(error=retry_error(503)))
+
+        assert pnc.fetch_forexfactory_calendar(days=7) == CACHED_EVENTS
+        assert 'server error (503)' in capsys.readouterr().out
+
+
+class TestGzipCache:
+    """Tests for the gzip cache file and the plaintext fallback."""
+
+    def test_save_writes_gzip(self):
+        pnc.save_cache(CACHED_EVENTS, etag='"v1"', days=7)
+
+        assert os.path.exists(pnc.CACHE_FILE_GZ)
+        assert not os.path.exists(pnc.CACHE_FILE)
+        assert pnc.load_cache() == CACHED_EVENTS
+
+    def test_plaintext_cache_is_read_when_no_gzip(self):
+        write_cache(age=timedelta(minutes=5), compress=False)
+
+        assert pnc.load_cache() == CACHED_EVENTS
+
+    def test_corrupt_gzip_falls_back_to_plaintext(self):
+        write_cache(age=timedelta(minutes=5), compress=False)
+        with open(pnc.CACHE_FILE_GZ, 'wb') as f:
+            f.write(b'not gzip')
+
+        assert pnc.load_cache() == CACHED_EVENTS
+
+    def test_gzip_is_preferred_over_plaintext(self):
+        write_cache(age=timedelta(minutes=5), compress=False, events=[])
+        write_cache(age=timedelta(minutes=5))
+
+        assert pnc.load_cache() == CACHED_EVENTS
+
+    def test_no_cache_files_returns_empty(self):
+        assert pnc.read_cache() == {}
+        assert pnc.load_cache() == []
+
+    def test_empty_events_are_not_saved(self):
+        pnc.save_cache([])
+        assert not os.path.exists(pnc.CACHE_FILE_GZ)
+
+
+class TestRetryErrorCause:
+    """Tests for naming the status that used up the retries."""
+
+    @pytest.mark.parametrize("status,expected", [
+        (429, 'rate limited (429)'),
+        (502, 'server error (502)'),
+        (503, 'server error (503)'),
+        (504, 'server error (504)'),
+    ])
+    def test_status_is_reported(self, status, expected):
+        assert pnc.retry_error_cause(retry_error(status)) == expected
+
+    def test_unrecognised_reason_is_passed_through(self):
+        error = requests.exceptions.RetryError('connection pool exhausted')
+        assert pnc.retry_error_cause(error) == 'connection pool exhausted'
+
+
+class TestMainOutputOrder:
+    """Tests for keeping each source's progress output together."""
+
+    def test_loader_output_is_printed_in_submission_order(self, monkeypatch, capsys):
+        """Sources finishing out of order still print their lines as unbroken blocks, in order."""
+        import threading
+        import time
+
+        finished = {name: threading.Event() for name in ('oanda', 'ff', 'manual')}
+
+        def loader(name, wait_for=None):
+            def load(_arg):
+                print(f"{name} start")
+                if wait_for:
+                    finished[wait_for].wait(timeout=5)
+                time.sleep(0.01)
+                print(f"{name} done")
+                finished[name].set()
+                return []
+            return load
+
+        # Manual finishes first, then Forex Factory, then OANDA
+        monkeypatch.setattr(pnc, 'fetch_oanda_calendar', loader('oanda', wait_for='ff'))
+        monkeypatch.setattr(pnc, 'fetch_forexfactory_calendar', loader('ff', wait_for='manual'))
+        monkeypatch.setattr(pnc, 'load_manual_events', loader('manual'))
+        monkeypatch.setattr(pnc, 'generate_sample_events', lambda days: [])
+        monkeypatch.setattr(sys, 'argv', ['pull_news_calendar.py', 'days=7'])
+        stdout = sys.stdout
+
+        pnc.main()
+
+        assert sys.stdout is stdout
+        lines = [line for line in capsys.readouterr().out.splitlines()
+                 if line.endswith(('start', 'done'))]
+        assert lines == ['oanda start', 'oanda done', 'ff start', 'ff done', 'manual start', 'manual done']
@@ -0,0 +1,103 @@
+"""
+Unit tests for set_take_profit helpers.
+Tests the stat-signature cache behind load_rr_config.
+"""
+
+import pytest
+import os
+import sys
+
+# Add project root and src to path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import set_take_profit
+from set_take_profit import load_rr_config
+
+
+DEFAULT_RR = {
+    'bear_market': {'short_rr': 1.0, 'long_rr': 0.5},
+    'bull_market': {'short_rr': 0.5, 'long_rr': 1.0}
+}
+
+
+class TestLoadRRConfigCache:
+    """Tests for reusing a parsed account config while the file is unchanged."""
+
+    @pytest.fixture(autouse=True)
+    def account_dir(self, tmp_path, monkeypatch):
+        """Run in an empty directory with a fresh cache."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(set_take_profit, '_RR_CACHE', {})
+        (tmp_path / 'account1').mkdir()
+        return tmp_path / 'account1'
+
+    @pytest.fixture
+    def yaml_loads(self, monkeypatch):
+        """Count YAML parses."""
+        calls = []
+        safe_load = set_take_profit.yaml.safe_load
+
+        def counting_safe_load(stream):
+            calls.append(stream)
+            return safe_load(stream)
+
+        monkeypatch.setattr(set_take_profit.yaml, 'safe_load', counting_safe_load)
+        return calls
+
+    def write_config(self, account_dir, short_rr):
+        (account_dir / 'config.yaml').write_text(
+            f"risk_reward:\n  bear_market:\n    short_rr: {short_rr}\n"
+        )
+
+    def test_missing_config_returns_defaults(self, yaml_loads):
+        assert load_rr_config('account1') == DEFAULT_RR
+        assert yaml_loads == []
+
+    def test_unchanged_config_is_parsed_once(self, account_dir, yaml_loads):
+        self.write_config(account_dir, 1.5)
+
+        first = load_rr_config('account1')
+        second = load_rr_config('account1')
+
+        assert len(yaml_loads) == 1
+        assert first == second
+        assert second['bear_market'] == {'short_rr': 1.5, 'long_rr': 0.5}
+
+    def test_returned_config_is_a_copy(self, account_dir):
+        """Editing the returned dict must not change later results."""
+        self.write_config(account_dir, 1.5)
+
+        load_rr_config('account1')['bear_market']['short_rr'] = 9.9
+
+        assert load_rr_config('account1')['bear_market']['short_rr'] == 1.5
+
+    def test_edited_config_is_reparsed(self, account_dir, yaml_loads):
+        self.write_config(account_dir, 1.5)
+        load_rr_config('account1')
+        self.write_config(account_dir, 2.25)
+
+        assert load_rr_config('account1')['bear_market']['short_rr'] == 2.25
+        assert len(yaml_loads) == 2
+
+    def test_atomic_replace_with_same_size_and_mtime_is_reparsed(self, account_dir, yaml_loads):
+        """A file swapped in by rename is caught by its inode even if size and mtime match."""
+        self.write_config(account_dir, 1.5)
+        load_rr_config('account1')
+        st = os.stat(account_dir / 'config.yaml')
+
+        replacement = account_dir / 'config.yaml.tmp'
+        replacement.write_text("risk_reward:\n  bear_market:\n    short_rr: 1.7\n")
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, account_dir / 'config.yaml')
+
+        assert load_rr_config('account1')['bear_market']['short_rr'] == 1.7
+        assert len(yaml_loads) == 2
+
+    def test_removed_config_falls_back_to_defaults(self, account_dir):
+        self.write_config(account_dir, 1.5)
+        load_rr_config('account1')
+        os.remove(account_dir / 'config.yaml')
+
+        assert load_rr_config('account1') == DEFAULT_RR
@@ -0,0 +1,119 @@
+"""
+Unit tests for enhanced_signal_filter.
+Tests that stopping the validations early never changes the decision.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add project root and src to path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from signal_filter_enhancement import _validate_njit, enhanced_signal_filter
+from src.indicators import calculate_pp_supertrend, get_current_signal
+
+
+def buy_signal(price, support=0.0, resistance=0.0, trend=1):
+    return {'signal': 'BUY', 'trend': trend, 'price': price,
+            'support': support, 'resistance': resistance}
+
+
+def indicator_frame(trend, close, atr):
+    return pd.DataFrame({'trend': trend, 'close': close, 'atr': atr})
+
+
+def validate(trend, close, atr, signal, threshold):
+    return _validate_njit(
+        trend, close, atr, float(signal['trend']), 1 if signal['signal'] == 'BUY' else -1, 3,
+        float(signal['price']), float(signal['support']), float(signal['resistance']), threshold
+    )
+
+
+class TestShortCircuit:
+    """Tests for skipping the remaining validations once a signal can't pass."""
+
+    def test_two_early_failures_skip_remaining_checks(self):
+        """Failing trend and volatility leaves at most 2/4, so momentum and S/R are skipped."""
+        n = 20
+        trend = np.full(n, -1.0)
+        close = np.linspace(1.10, 1.11, n)
+        atr = np.full(n, 0.0001)
+        atr[-1] = 0.01  # Volatility spike
+
+        result = enhanced_signal_filter(
+            indicator_frame(trend, close, atr),
+            buy_signal(close[-1], support=close[-1], resistance=close[-1] * 1.01)
+        )
+
+        assert result['signal'] == 'HOLD_FILTERED'
+        assert result['filter_passed'] is False
+        assert result['filter_reason'] == "Failed validation (short-circuit after 2 checks)"
+        assert 'validations' not in result
+
+    def test_one_early_failure_runs_all_checks(self):
+        """One failure can still reach 3/4, so every check runs and is reported."""
+        n = 20
+        trend = np.full(n, -1.0)
+        close = np.linspace(1.10, 1.11, n)
+        atr = np.full(n, 0.0001)
+
+        result = enhanced_signal_filter(
+            indicator_frame(trend, close, atr),
+            buy_signal(close[-1], support=close[-1], resistance=close[-1] * 1.01)
+        )
+
+        assert result['validations'] == {'trend_strength': False, 'price_momentum': True,
+                                          'volatility_check': True, 'support_resistance': True}
+        assert result['filter_passed'] is True
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_short_circuit_matches_full_evaluation(self, seed):
+        """Whenever checks are skipped, evaluating them all would also fail the signal."""
+        rng = np.random.default_rng(seed)
+        for _ in range(200):
+            n = int(rng.integers(1, 30))
+            trend = rng.choice([-1.0, 1.0], size=n)
+            close = 1.1 + np.cumsum(rng.normal(0, 0.001, size=n))
+            atr = np.abs(rng.normal(0.0005, 0.0004, size=n))
+            atr[rng.random(n) < 0.1] = np.nan
+            price = close[-1]
+            signal = buy_signal(price, support=price * (1 + rng.choice([0.0, 0.001, 0.01])),
+                                resistance=price * 1.01, trend=rng.choice([-1, 1]))
+            if rng.random() < 0.5:
+                signal['signal'] = 'SELL'
+
+            early = validate(trend, close, atr, signal, 0.6)
+            full = validate(trend, close, atr, signal, 0.0)
+
+            assert (full >= 0).all()
+            if (early < 0).any():
+                assert full.sum() / 4 < 0.6
+                ran = early >= 0
+                assert (early[ran] == full[ran]).all()
+            else:
+                assert (early == full).all()
+
+    def test_indicator_frame_gives_same_decision_as_full_evaluation(self, sample_ranging_candles):
+        """End to end on real indicator output: passed/filtered agrees with all four checks."""
+        df = calculate_pp_supertrend(sample_ranging_candles)
+        checked = 0
+        for end in range(15, len(df) + 1):
+            window = df.iloc[:end]
+            signal = get_current_signal(window)
+            if not signal or signal['signal'] not in ('BUY', 'SELL'):
+                continue
+
+            result = enhanced_signal_filter(window, signal)
+            full = validate(window['trend'].to_numpy(dtype=np.float64),
+                            window['close'].to_numpy(dtype=np.float64),
+                            window['atr'].to_numpy(dtype=np.float64),
+                            {**signal, 'support': signal.get('support') or 0.0,
+                             'resistance': signal.get('resistance') or 0.0}, 0.0)
+            assert result['filter_passed'] == (full.sum() / 4 >= 0.6)
+            checked += 1
+        assert checked > 0